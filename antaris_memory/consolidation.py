@@ -90,9 +90,10 @@ class ConsolidationEngine:
     def run(self, memories: List[MemoryEntry]) -> Dict:
         """Full consolidation pass — returns a report."""
         now = datetime.now()
-        scored = [(m, self.decay.score(m, now)) for m in memories]
-        archive = [(m, s) for m, s in scored if self.decay.should_archive(m, now)]
-        active = [(m, s) for m, s in scored if not self.decay.should_archive(m, now)]
+        scored = list(zip(memories, self.decay.score_batch(memories, now)))
+        threshold = self.decay.archive_threshold  # should_archive(), without rescoring
+        archive = [(m, s) for m, s in scored if s < threshold]
+        active = [(m, s) for m, s in scored if s >= threshold]
 
         dupes = self.find_duplicates(memories)
         clusters = self.topic_clusters(memories)
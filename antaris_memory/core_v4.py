@@ -38,7 +38,7 @@ from .forgetting import ForgettingEngine
 from .consolidation import ConsolidationEngine
 from .gating import InputGate
 from .synthesis import KnowledgeSynthesizer
-from .sharding import ShardManager
+from .sharding import SHARD_FILE_SUFFIXES, ShardManager
 from .migration import MigrationManager
 from .indexing import IndexManager
 from .search import SearchEngine, SearchResult
@@ -48,7 +48,7 @@ from .memory_types import (
     MEMORY_TYPE_CONFIGS, DEFAULT_TYPE, get_type_config,
     format_mistake_content, SEVERITY_LEVELS,
 )
-from .utils import atomic_write_json
+from .utils import append_jsonl, atomic_write_json, load_json_bytes
 from .performance import ReadCache, WALManager, PerformanceMonitor, AccessTracker
 from .feedback import RetrievalFeedback
 
@@ -74,6 +74,9 @@ class MemorySystemV4(NamespaceManager):
         Whether to use sharded storage (default True for v0.4).
     use_indexing : bool
         Whether to build search indexes (default True for v0.4).
+    compress_shards : bool
+        Store shards as gzip'd compact JSON instead of indented JSON
+        (default False). Existing shards in either format are still read.
     """
 
     def __init__(
@@ -85,6 +88,7 @@ class MemorySystemV4(NamespaceManager):
         use_indexing: bool = True,
         enable_read_cache: bool = True,
         cache_max_entries: int = 1000,
+        compress_shards: bool = False,
     ):
         self.workspace = os.path.abspath(workspace)
         self.use_sharding = use_sharding
@@ -97,7 +101,9 @@ class MemorySystemV4(NamespaceManager):
 
         # v0.4 managers
         self.migration_manager = MigrationManager(workspace)
-        self.shard_manager = ShardManager(workspace) if use_sharding else None
+        self.shard_manager = (
+            ShardManager(workspace, compress=compress_shards) if use_sharding else None
+        )
         self.index_manager = IndexManager(workspace) if use_indexing else None
 
         # Engines (same as v0.3)
@@ -189,10 +195,14 @@ class MemorySystemV4(NamespaceManager):
         # Save shard index
         self.shard_manager.index.save_index()
         
-        # Update search indexes — skipped during bulk_ingest to avoid O(n²)
+        # Update search indexes — skipped during bulk_ingest to avoid O(n²).
+        # Only entries added, removed or edited since the last save are
+        # re-indexed, and the index files are rewritten only if that changed
+        # anything.
         if self.use_indexing and self.index_manager and not self._bulk_mode_active:
-            self.index_manager.rebuild_indexes(self.memories)
-            self.index_manager.save_all_indexes()
+            self.index_manager.sync(self.memories)
+            if self.index_manager.dirty:
+                self.index_manager.save_all_indexes()
 
         shard_dir = os.path.join(self.workspace, "shards")
         return shard_dir
@@ -208,7 +218,7 @@ class MemorySystemV4(NamespaceManager):
             "format": "legacy",
             "memories": [m.to_dict() for m in self.memories],
         }
-        atomic_write_json(self.legacy_metadata_path, data)
+        atomic_write_json(self.legacy_metadata_path, data, compact=True)
         return self.legacy_metadata_path
 
     # ── WAL flush / close ─────────────────────────────────────────────────
@@ -325,8 +335,9 @@ class MemorySystemV4(NamespaceManager):
                 stacklevel=3,
             )
         self._hashes = {m.hash for m in self.memories}
-        if self.memories:
-            self.search_engine.build_index(self.memories)
+        # The BM25 index is built by the first search(), not here: loads
+        # that are only followed by ingest/stats/temporal calls skip it.
+        self.search_engine.mark_dirty()
         return len(self.memories)
 
     def _load_legacy(self) -> int:
@@ -334,13 +345,12 @@ class MemorySystemV4(NamespaceManager):
         if not os.path.exists(self.legacy_metadata_path):
             return 0
 
-        with open(self.legacy_metadata_path) as f:
-            data = json.load(f)
+        with open(self.legacy_metadata_path, "rb") as f:
+            data = load_json_bytes(f.read())
 
         self.memories = [MemoryEntry.from_dict(d) for d in data.get("memories", [])]
         self._hashes = {m.hash for m in self.memories}
-        if self.memories:
-            self.search_engine.build_index(self.memories)
+        self.search_engine.mark_dirty()  # built lazily, as in _load_sharded
         return len(self.memories)
 
     # ── Sprint 3: embedding interface ────────────────────────────────────
@@ -633,14 +643,37 @@ class MemorySystemV4(NamespaceManager):
         """
         cfg = get_type_config(memory_type, type_config)
         count = 0
+        wal_records = []  # journaled in one write at the end of the call
+        try:
+            count = self._ingest_lines(content, source, category, memory_type,
+                                       type_config, tags, cfg, wal_records)
+        finally:
+            if wal_records:
+                self._wal.append_many(wal_records)
+
+        # Invalidate read-cache on write
+        if count and self._read_cache is not None:
+            self._read_cache.invalidate()
+
+        # Auto-flush if WAL threshold is reached
+        if self._wal.should_flush():
+            self.flush()
+
+        return count
+
+    def _ingest_lines(self, content, source, category, memory_type,
+                      type_config, tags, cfg, wal_records) -> int:
+        """Per-line body of ingest(); queues each new entry's WAL record."""
+        count = 0
         for i, line in enumerate(content.split("\n")):
             stripped = line.strip()
             if len(stripped) < 15 or stripped.startswith("```") or stripped == "---":
                 continue
 
-            entry = MemoryEntry(stripped, source, i + 1, category,
-                                memory_type=memory_type)
-            if entry.hash in self._hashes:
+            # Duplicates (e.g. a re-ingested file) and noise are dropped
+            # before any per-entry work, including building the entry
+            entry_hash = MemoryEntry.compute_hash(stripped, source, i + 1)
+            if entry_hash in self._hashes:
                 continue
 
             # Process through gating system
@@ -648,6 +681,9 @@ class MemorySystemV4(NamespaceManager):
             if gate_priority == "P3":  # Skip noise
                 continue
 
+            entry = MemoryEntry(stripped, source, i + 1, category,
+                                memory_type=memory_type, entry_hash=entry_hash)
+
             entry.tags = self._extract_tags(stripped)
             # Merge caller-supplied tags with auto-extracted tags (Bug fix #12)
             if tags:
@@ -665,23 +701,15 @@ class MemorySystemV4(NamespaceManager):
 
             self.memories.append(entry)
             self._hashes.add(entry.hash)
-            self.search_engine.mark_dirty()
+            self.search_engine.add_documents([entry])
 
-            if self.use_indexing and self.index_manager:
+            # In bulk mode the indexes are synced once on exit instead
+            if self.use_indexing and self.index_manager and not self._bulk_mode_active:
                 self.index_manager.add_memory(entry)
 
             # Sprint 11 — WAL append
-            self._wal.append(entry.to_dict())
+            wal_records.append(entry.to_dict())
             count += 1
-
-        # Invalidate read-cache on write
-        if count and self._read_cache is not None:
-            self._read_cache.invalidate()
-
-        # Auto-flush if WAL threshold is reached
-        if self._wal.should_flush():
-            self.flush()
-
         return count
 
     def ingest_file(self, file_path: str, category: str = "tactical") -> int:
@@ -696,17 +724,33 @@ class MemorySystemV4(NamespaceManager):
         except (OSError, UnicodeDecodeError):
             return 0
 
+    def ingest_many(self, paths: List[str], category: str = "tactical") -> int:
+        """Ingest several files with one deferred flush and index pass.
+
+        Equivalent to calling ``ingest_file()`` on each path, but runs
+        inside ``bulk_mode()``: WAL auto-flushes that would otherwise
+        rewrite every shard every few hundred lines are deferred, and the
+        store is saved and re-indexed once at the end.
+
+        Returns:
+            Total number of new memories added.
+        """
+        total = 0
+        with self.bulk_mode():
+            for path in paths:
+                total += self.ingest_file(str(path), category)
+        return total
+
     def ingest_directory(self, dir_path: str, category: str = "tactical",
                         pattern: str = "*.md") -> int:
-        """Ingest all matching files in a directory."""
+        """Ingest all matching files in a directory (see ``ingest_many``)."""
         if not os.path.exists(dir_path):
             return 0
         
-        total = 0
-        for path in Path(dir_path).glob(pattern):
-            if path.is_file():
-                total += self.ingest_file(str(path), category)
-        return total
+        return self.ingest_many(
+            [path for path in Path(dir_path).glob(pattern) if path.is_file()],
+            category,
+        )
 
     # ── Sprint 2: typed ingest methods ──────────────────────────────────
 
@@ -757,7 +801,7 @@ class MemorySystemV4(NamespaceManager):
 
         self.memories.append(entry)
         self._hashes.add(entry.hash)
-        self.search_engine.mark_dirty()
+        self.search_engine.add_documents([entry])
 
         if self.use_indexing and self.index_manager:
             self.index_manager.add_memory(entry)
@@ -844,7 +888,7 @@ class MemorySystemV4(NamespaceManager):
 
             self.memories.append(entry)
             self._hashes.add(entry.hash)
-            self.search_engine.mark_dirty()
+            self.search_engine.add_documents([entry])
 
             if self.use_indexing and self.index_manager:
                 self.index_manager.add_memory(entry)
@@ -890,33 +934,39 @@ class MemorySystemV4(NamespaceManager):
         """
         self._bulk_mode_active = True
         count = 0
+        # An item identical to an earlier one in the batch can add nothing
+        # (its lines are already stored or were gated out), so repeats are
+        # dropped with one set lookup instead of a full ingest() call.
+        seen = set()
         try:
             for item in entries:
                 if isinstance(item, str):
+                    if item in seen:
+                        continue
+                    seen.add(item)
                     count += self.ingest(item)
                 elif isinstance(item, dict):
                     content = item.get("content", "")
                     if not content:
                         continue
+                    source = item.get("source", "inline")
+                    category = item.get("category", "general")
+                    memory_type = item.get("memory_type", DEFAULT_TYPE)
+                    tags = item.get("tags")
+                    key = (content, source, category, memory_type,
+                           tuple(tags) if tags else None)
+                    if key in seen:
+                        continue
+                    seen.add(key)
                     count += self.ingest(
                         content,
-                        source=item.get("source", "inline"),
-                        category=item.get("category", "general"),
-                        memory_type=item.get("memory_type", DEFAULT_TYPE),
-                        tags=item.get("tags"),
+                        source=source,
+                        category=category,
+                        memory_type=memory_type,
+                        tags=tags,
                     )
         finally:
-            self._bulk_mode_active = False
-            # One final flush + index rebuild after all items are ingested
-            if self._wal.pending_count() > 0:
-                self.flush()
-            else:
-                # Even if WAL was auto-flushed mid-bulk, rebuild indexes once
-                if self.use_indexing and self.index_manager:
-                    self.index_manager.rebuild_indexes(self.memories)
-                    self.index_manager.save_all_indexes()
-            if self._read_cache is not None:
-                self._read_cache.invalidate()
+            self._end_bulk_mode()
 
         return count
 
@@ -939,16 +989,26 @@ class MemorySystemV4(NamespaceManager):
         try:
             yield self
         finally:
-            self._bulk_mode_active = False
-            # Final flush + rebuild on exit
-            if self._wal.pending_count() > 0:
-                self.flush()
-            else:
-                if self.use_indexing and self.index_manager:
-                    self.index_manager.rebuild_indexes(self.memories)
-                    self.index_manager.save_all_indexes()
-            if self._read_cache is not None:
-                self._read_cache.invalidate()
+            self._end_bulk_mode()
+
+    def _end_bulk_mode(self) -> None:
+        """Leave bulk mode: one final flush (or index rebuild) for the batch."""
+        self._bulk_mode_active = False
+        # Deferred flushes reset the WAL counter but leave the journal in
+        # place, so a non-empty WAL file also means shards are out of date.
+        if self._wal.pending_count() > 0 or self._wal.size_bytes() > 0:
+            self.flush()
+        elif self.use_indexing and self.index_manager:
+            # Nothing journaled (e.g. every item was a duplicate): only
+            # re-index, and rewrite the index files, if something changed
+            self.index_manager.sync(self.memories)
+            if self.index_manager.dirty:
+                self.index_manager.save_all_indexes()
+        if self.use_indexing and self.index_manager and not self.use_sharding:
+            # Legacy saves don't sync the indexes; ingest() skipped them
+            self.index_manager.sync(self.memories)
+        if self._read_cache is not None:
+            self._read_cache.invalidate()
 
     # ── analysis & synthesis ────────────────────────────────────────────
 
@@ -1164,11 +1224,11 @@ class MemorySystemV4(NamespaceManager):
             shards_dir = os.path.join(self.workspace, "shards")
             if os.path.isdir(shards_dir):
                 shards_before = len([
-                    f for f in os.listdir(shards_dir) if f.endswith(".json")
+                    f for f in os.listdir(shards_dir) if f.endswith(SHARD_FILE_SUFFIXES)
                 ])
                 disk_before = sum(
                     os.path.getsize(os.path.join(shards_dir, f))
-                    for f in os.listdir(shards_dir) if f.endswith(".json")
+                    for f in os.listdir(shards_dir) if f.endswith(SHARD_FILE_SUFFIXES)
                 ) / (1024 * 1024)
 
         entries_before = len(self.memories)
@@ -1224,11 +1284,11 @@ class MemorySystemV4(NamespaceManager):
             shards_dir = os.path.join(self.workspace, "shards")
             if os.path.isdir(shards_dir):
                 shards_after = len([
-                    f for f in os.listdir(shards_dir) if f.endswith(".json")
+                    f for f in os.listdir(shards_dir) if f.endswith(SHARD_FILE_SUFFIXES)
                 ])
                 disk_after = sum(
                     os.path.getsize(os.path.join(shards_dir, f))
-                    for f in os.listdir(shards_dir) if f.endswith(".json")
+                    for f in os.listdir(shards_dir) if f.endswith(SHARD_FILE_SUFFIXES)
                 ) / (1024 * 1024)
 
         entries_after = len(self.memories)
@@ -1332,7 +1392,7 @@ class MemorySystemV4(NamespaceManager):
         """
         s = self.get_stats()
         now = datetime.now()
-        scores = [self.decay.score(m, now) for m in self.memories]
+        scores = self.decay.score_batch(self.memories, now)
         sentiments: Dict[str, int] = defaultdict(int)
         for m in self.memories:
             dom = self.sentiment.dominant(m.sentiment)
@@ -1355,7 +1415,7 @@ class MemorySystemV4(NamespaceManager):
             if os.path.isdir(shards_dir):
                 shard_files = [
                     os.path.join(shards_dir, f)
-                    for f in os.listdir(shards_dir) if f.endswith(".json")
+                    for f in os.listdir(shards_dir) if f.endswith(SHARD_FILE_SUFFIXES)
                 ]
                 shards_count = len(shard_files)
                 disk_mb = sum(os.path.getsize(p) for p in shard_files) / (1024 * 1024)
@@ -1867,8 +1927,7 @@ class MemorySystemV4(NamespaceManager):
         Replaces the previous JSON-array approach which was O(n) read + O(n) write
         per operation, causing O(n²) behaviour during bulk forget/purge.
         """
-        with open(self.audit_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+        append_jsonl(self.audit_path, entry, fsync=False)
 
 
 # Backward compatibility alias
@@ -5,6 +5,7 @@ Sprint 2: type-aware half-life via MEMORY_TYPE_CONFIGS decay_multiplier.
 
 import math
 from datetime import datetime
+from typing import List
 from .entry import MemoryEntry
 
 # Defaults — users can override via MemorySystem config
@@ -65,6 +66,39 @@ class DecayEngine:
         )
         return round(min(base_decay + reinforcement, self.max_score), 4)
 
+    def score_batch(self, entries: List[MemoryEntry],
+                    now: datetime = None) -> List[float]:
+        """``score()`` for many entries, in order.
+
+        Same arithmetic (and results) as calling ``score`` per entry, with
+        the clock read, type-config import and per-type half-life lookups
+        done once per batch instead of once per entry.
+        """
+        from .memory_types import MEMORY_TYPE_CONFIGS
+        now = now or datetime.now()
+        pow_, fromiso = math.pow, datetime.fromisoformat
+        boost, max_score = self.reinforcement_boost, self.max_score
+        type_hl = {}  # memory_type -> effective half-life for built-in types
+        scores = []
+        for entry in entries:
+            memory_type = getattr(entry, "memory_type", "episodic") or "episodic"
+            effective_hl = type_hl.get(memory_type)
+            if effective_hl is None:
+                if memory_type in MEMORY_TYPE_CONFIGS:
+                    effective_hl = type_hl[memory_type] = (
+                        self.half_life * MEMORY_TYPE_CONFIGS[memory_type]["decay_multiplier"])
+                else:  # custom type: multiplier may differ per entry
+                    effective_hl = self.half_life * self._type_multiplier(entry)
+            age_days = max((now - fromiso(entry.created)).total_seconds() / 86400, 0.001)
+            strength = entry.importance * pow_(2, -age_days / effective_hl)
+            if entry.access_count:  # never-accessed entries get no reinforcement
+                strength += (
+                    entry.access_count * boost
+                    * pow_(2, -age_days / (effective_hl * 2))
+                )
+            scores.append(round(min(strength, max_score), 4))
+        return scores
+
     def reinforce(self, entry: MemoryEntry) -> None:
         """Boost a memory when it's accessed."""
         entry.access_count += 1
@@ -1,10 +1,16 @@
 """Memory entry — the atomic unit of memory."""
 
 import hashlib
+import sys
 from datetime import datetime
 from typing import Dict, List, Optional
 
 
+def _intern(value):
+    """``sys.intern`` for exact ``str`` values; anything else as-is."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class MemoryEntry:
     """Single memory unit with metadata, decay, sentiment, and confidence.
 
@@ -35,11 +41,14 @@ class MemoryEntry:
         category: str = "general",
         created: str = None,
         memory_type: str = "episodic",
+        entry_hash: Optional[str] = None,
     ):
         self.content = content
-        self.source = source
+        # Low-cardinality labels: shards decode one str object per entry
+        # for each, so share them instead of keeping thousands of copies
+        self.source = _intern(source)
         self.line = line
-        self.category = category
+        self.category = _intern(category)
         self.created = created or datetime.now().isoformat()
         self.last_accessed = self.created
         self.access_count: int = 0
@@ -52,13 +61,22 @@ class MemoryEntry:
         # BLAKE2b-128 (128-bit, collision-resistant, not cryptographically broken).
         # digest_size=16 → 32 hex chars.  Existing stores with 12-char MD5 hashes
         # require the migration script: tools/migrate_hashes.py
-        self.hash = hashlib.blake2b(
+        # A known hash (e.g. from storage) is taken as-is, skipping the digest.
+        self.hash = entry_hash or self.compute_hash(content, source, line)
+        # Sprint 2
+        self.memory_type: str = _intern(memory_type)
+        self.type_metadata: Dict = {}
+
+    @staticmethod
+    def compute_hash(content: str, source: str = "", line: int = 0) -> str:
+        """The ``hash`` an entry built from these arguments would get.
+
+        Lets callers check for a duplicate before constructing the entry.
+        """
+        return hashlib.blake2b(
             f"{source}:{line}:{content[:100]}".encode(),
             digest_size=16,
         ).hexdigest()
-        # Sprint 2
-        self.memory_type: str = memory_type
-        self.type_metadata: Dict = {}
 
     # -- serialisation --------------------------------------------------------
 
@@ -91,15 +109,15 @@ class MemoryEntry:
             d.get("content", ""), d.get("source", ""), d.get("line", 0),
             d.get("category", "general"), d.get("created"),
             memory_type=d.get("memory_type", "episodic"),
+            entry_hash=d.get("hash"),
         )
         m.last_accessed = d.get("last_accessed", m.created)
         m.access_count = d.get("access_count", 0)
         m.importance = d.get("importance", 1.0)
         m.confidence = d.get("confidence", 0.5)
         m.sentiment = d.get("sentiment", {})
-        m.tags = d.get("tags", [])
+        m.tags = [_intern(t) for t in d.get("tags") or ()]
         m.related = d.get("related", [])
-        m.hash = d.get("hash", m.hash)
         m.type_metadata = d.get("type_metadata", {})
         return m
 
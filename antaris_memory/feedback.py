@@ -21,6 +21,8 @@ import os
 import time
 from typing import TYPE_CHECKING, List, Optional
 
+from .utils import append_jsonl
+
 if TYPE_CHECKING:
     from .entry import MemoryEntry
 
@@ -207,7 +209,6 @@ class RetrievalFeedback:
         record = {"ts": time.time(), **kwargs}
         os.makedirs(self.workspace, exist_ok=True)
         try:
-            with open(self._log_path, "a", encoding="utf-8") as fh:
-                fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+            append_jsonl(self._log_path, record, fsync=False)
         except OSError:
             pass  # non-fatal: feedback persistence is best-effort
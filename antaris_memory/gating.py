@@ -11,8 +11,12 @@ P3 content is typically filtered out to prevent noise pollution.
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Optional
 
+# Distinct texts whose pattern-based tier each InputGate remembers
+CLASSIFY_CACHE_SIZE = 4096
+
 
 class InputGate:
     """Intelligent content triage system for memory intake."""
@@ -80,6 +84,25 @@ class InputGate:
             r'^.{1,3}$',  # Single chars, emoticons, etc.
         ]
 
+        # One precompiled alternation per tier: a tier matches iff any of
+        # its patterns does, in one regex call instead of a cache lookup +
+        # call per pattern. classify() lowercases its input, so the
+        # (lowercase) patterns are compiled case-sensitively; IGNORECASE
+        # makes every alternative several times slower to try.
+        self._p0_re = self._union(self._p0_patterns)
+        self._p1_re = self._union(self._p1_patterns)
+        self._p2_re = self._union(self._p2_patterns)
+        self._p3_re = self._union(self._p3_patterns)
+
+        # Repeated texts (acknowledgements, re-ingested lines, route() then
+        # ingest() on the same line) skip the regex scans. Only the
+        # pattern stage is cached; context hints are checked every call.
+        self._classify_text = lru_cache(maxsize=CLASSIFY_CACHE_SIZE)(self._classify_text)
+
+    @staticmethod
+    def _union(patterns) -> "re.Pattern":
+        return re.compile("|".join(f"(?:{p})" for p in patterns))
+
     def classify(self, content: str, context: Dict = None) -> str:
         """Classify content priority level: P0, P1, P2, or P3.
         
@@ -114,31 +137,25 @@ class InputGate:
             elif category in ['tactical', 'technical']:
                 return "P2"
         
-        # Pattern-based classification
-        for pattern in self._p0_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "P0"
+        return self._classify_text(text)
+
+    def _classify_text(self, text: str) -> str:
+        """Pattern-based tier of stripped, lowercased ``text``."""
+        if self._p0_re.search(text):
+            return "P0"
                 
-        for pattern in self._p1_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "P1"
+        if self._p1_re.search(text):
+            return "P1"
                 
         # P3 patterns need to match more precisely
-        for pattern in self._p3_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                return "P3"
-        
-        for pattern in self._p2_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "P2"
-                
-        # Default classification based on length and complexity
-        if len(text) < 15:
+        if self._p3_re.match(text):
             return "P3"
-        elif any(word in text for word in ['project', 'system', 'data', 'code', 'feature']):
+        
+        # Everything else is contextual, except short text with no P2
+        # signal (so the P2 patterns only need checking for short text)
+        if len(text) >= 15 or self._p2_re.search(text):
             return "P2"
-        else:
-            return "P2"  # Default to contextual
+        return "P3"
 
     def should_store(self, content: str, context: Dict = None) -> bool:
         """Determine if content should be stored in memory.
@@ -176,5 +193,5 @@ class InputGate:
         return {
             "priority": priority,
             "category": category_map[priority],
-            "store": self.should_store(content, context)
+            "store": priority != "P3",  # should_store(), without reclassifying
         }
\ No newline at end of file
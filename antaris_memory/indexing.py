@@ -10,6 +10,7 @@ Creates lightweight indexes for:
 All indexes are stored as JSON files for transparency and debuggability.
 """
 
+import heapq
 import json
 import os
 import re
@@ -18,6 +19,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
 
 from .entry import MemoryEntry
+from .utils import load_json_bytes
 
 
 class SearchIndex:
@@ -119,9 +121,15 @@ class SearchIndex:
         if memory_hash in self.memory_metadata:
             del self.memory_metadata[memory_hash]
     
-    def search(self, query: str, limit: int = 50) -> List[Tuple[str, float]]:
+    def search(self, query: str, limit: int = 50,
+               candidates: Optional[Set[str]] = None) -> List[Tuple[str, float]]:
         """Search for memories matching the query.
         
+        Args:
+            query: Free-text query.
+            limit: Maximum number of results.
+            candidates: If given, only these memory hashes are scored.
+        
         Returns list of (memory_hash, relevance_score) tuples.
         """
         query_words = self._extract_words(query)
@@ -132,13 +140,25 @@ class SearchIndex:
         memory_scores = defaultdict(float)
         
         for word in query_words:
-            if word in self.word_index:
-                for memory_hash, tf_score in self.word_index[word].items():
+            postings = self.word_index.get(word)
+            if not postings:
+                continue
+            if candidates is None:
+                for memory_hash, tf_score in postings.items():
                     memory_scores[memory_hash] += tf_score
+            elif len(candidates) < len(postings):
+                # Walk the shorter side
+                for memory_hash in candidates:
+                    tf_score = postings.get(memory_hash)
+                    if tf_score is not None:
+                        memory_scores[memory_hash] += tf_score
+            else:
+                for memory_hash, tf_score in postings.items():
+                    if memory_hash in candidates:
+                        memory_scores[memory_hash] += tf_score
         
-        # Sort by relevance score
-        results = sorted(memory_scores.items(), key=lambda x: x[1], reverse=True)
-        return results[:limit]
+        # Top results by relevance score
+        return heapq.nlargest(limit, memory_scores.items(), key=lambda x: x[1])
     
     def get_memory_metadata(self, memory_hash: str) -> Optional[Dict]:
         """Get metadata for a memory by its hash."""
@@ -157,7 +177,7 @@ class SearchIndex:
         }
         
         from .utils import atomic_write_json
-        atomic_write_json(self.index_path, data)
+        atomic_write_json(self.index_path, data, compact=True)
     
     def load_index(self):
         """Load the search index from disk."""
@@ -165,8 +185,8 @@ class SearchIndex:
             return
         
         try:
-            with open(self.index_path) as f:
-                data = json.load(f)
+            with open(self.index_path, "rb") as f:
+                data = load_json_bytes(f.read())
             
             self.word_index = data.get("word_index", {})
             self.term_frequencies = data.get("term_frequencies", {})
@@ -268,13 +288,14 @@ class TagIndex:
             return list(result)
         
         elif mode == "all":
-            # Intersection of all tag results
-            if not tags:
-                return []
-            
-            result = set(self.tag_to_memories.get(tags[0], []))
-            for tag in tags[1:]:
-                result &= set(self.tag_to_memories.get(tag, []))
+            # Intersection of all tag results, smallest posting list first
+            # so the working set only shrinks
+            postings = sorted((self.tag_to_memories.get(tag, []) for tag in tags), key=len)
+            result = set(postings[0])
+            for hashes in postings[1:]:
+                if not result:
+                    break
+                result.intersection_update(hashes)
             return list(result)
         
         else:
@@ -296,7 +317,7 @@ class TagIndex:
         }
         
         from .utils import atomic_write_json
-        atomic_write_json(self.index_path, data)
+        atomic_write_json(self.index_path, data, compact=True)
     
     def load_index(self):
         """Load the tag index from disk."""
@@ -304,8 +325,8 @@ class TagIndex:
             return
         
         try:
-            with open(self.index_path) as f:
-                data = json.load(f)
+            with open(self.index_path, "rb") as f:
+                data = load_json_bytes(f.read())
             
             self.tag_to_memories = defaultdict(list, data.get("tag_to_memories", {}))
             self.memory_to_tags = data.get("memory_to_tags", {})
@@ -395,7 +416,7 @@ class DateIndex:
         }
         
         from .utils import atomic_write_json
-        atomic_write_json(self.index_path, data)
+        atomic_write_json(self.index_path, data, compact=True)
     
     def load_index(self):
         """Load the date index from disk."""
@@ -403,8 +424,8 @@ class DateIndex:
             return
         
         try:
-            with open(self.index_path) as f:
-                data = json.load(f)
+            with open(self.index_path, "rb") as f:
+                data = load_json_bytes(f.read())
             
             self.date_to_memories = defaultdict(list, data.get("date_to_memories", {}))
             self.memory_to_date = data.get("memory_to_date", {})
@@ -424,18 +445,69 @@ class IndexManager:
         self.search_index = SearchIndex(workspace)
         self.tag_index = TagIndex(workspace)
         self.date_index = DateIndex(workspace)
+        
+        # memory_hash -> _signature() of the entry as last indexed; only
+        # tracked once the indexes have been built in this process
+        self._signatures: Dict[str, tuple] = {}
+        self._synced = False
+        # In-memory indexes differ from the files on disk
+        self.dirty = False
+    
+    @staticmethod
+    def _signature(memory: MemoryEntry) -> tuple:
+        """The entry fields the indexes read; re-index when any changes."""
+        return (memory.content, memory.category, memory.created,
+                memory.confidence, memory.source, tuple(memory.tags))
     
     def add_memory(self, memory: MemoryEntry):
         """Add a memory to all indexes."""
         self.search_index.add_memory(memory)
         self.tag_index.add_memory(memory)
         self.date_index.add_memory(memory)
+        self._signatures[memory.hash] = self._signature(memory)
+        self.dirty = True
     
     def remove_memory(self, memory_hash: str):
         """Remove a memory from all indexes."""
         self.search_index.remove_memory(memory_hash)
         self.tag_index.remove_memory(memory_hash)
         self.date_index.remove_memory(memory_hash)
+        self._signatures.pop(memory_hash, None)
+        self.dirty = True
+    
+    def sync(self, memories: List[MemoryEntry]):
+        """Bring the indexes in line with ``memories``, re-indexing only changes.
+        
+        Entries that are new, or whose indexed fields changed in place, are
+        (re-)indexed; indexed hashes no longer in ``memories`` are removed.
+        The first sync in a process (the indexes came from disk, so their
+        entries' fields are unknown) is a full ``rebuild_indexes``, as is
+        one where most of the corpus changed.
+        """
+        if not self._synced:
+            self.rebuild_indexes(memories)
+            return
+        
+        signature = self._signature
+        known = self._signatures
+        present = set()
+        changed = []
+        for memory in memories:
+            present.add(memory.hash)
+            if known.get(memory.hash) != signature(memory):
+                changed.append(memory)
+        removed = [h for h in known if h not in present]
+        
+        if len(changed) + len(removed) > len(memories) // 2:
+            self.rebuild_indexes(memories)
+            return
+        for memory_hash in removed:
+            self.remove_memory(memory_hash)
+        for memory in changed:
+            if memory.hash in known:
+                # Drop words/tags/date the entry no longer has
+                self.remove_memory(memory.hash)
+            self.add_memory(memory)
     
     def search(self, 
                query: str,
@@ -443,48 +515,41 @@ class IndexManager:
                tag_mode: str = "any",
                date_range: Optional[Tuple[str, str]] = None,
                limit: int = 50) -> List[Tuple[str, float]]:
-        """Combined search across all indexes."""
+        """Combined search across all indexes.
         
-        # Start with all candidate hashes
-        candidate_hashes = None
-        text_scores = {}
+        Tag and date filters are intersected first; the text query is then
+        scored only against the surviving candidates, so a selective
+        filter never has to wait on (or be starved by) a broad query.
+        """
         
-        # Get text search results if query is provided
-        if query and query.strip():
-            text_results = self.search_index.search(query, limit=limit*2)
-            candidate_hashes = {hash for hash, score in text_results}
-            text_scores = {hash: score for hash, score in text_results}
+        # Candidate hashes from the tag / date filters
+        candidate_hashes = None
         
         # Filter by tags if specified
         if tags:
-            tag_hashes = set(self.tag_index.get_memories_by_tags(tags, mode=tag_mode))
-            if candidate_hashes is None:
-                candidate_hashes = tag_hashes
-            else:
-                candidate_hashes &= tag_hashes
+            candidate_hashes = set(self.tag_index.get_memories_by_tags(tags, mode=tag_mode))
         
         # Filter by date range if specified
-        if date_range:
+        if date_range and (candidate_hashes is None or candidate_hashes):
             start_date, end_date = date_range
-            date_hashes = set(self.date_index.get_memories_in_range(start_date, end_date))
+            date_hashes = self.date_index.get_memories_in_range(start_date, end_date)
             if candidate_hashes is None:
-                candidate_hashes = date_hashes
+                candidate_hashes = set(date_hashes)
             else:
-                candidate_hashes &= date_hashes
+                candidate_hashes.intersection_update(date_hashes)
+        
+        # Text search within the candidates if a query is provided
+        if query and query.strip():
+            if candidate_hashes is not None and not candidate_hashes:
+                return []
+            return self.search_index.search(query, limit=limit, candidates=candidate_hashes)
         
         # If no filters were applied, return empty results
         if candidate_hashes is None:
             return []
         
-        # Create results with scores (default score of 1.0 for non-text matches)
-        results = []
-        for hash in candidate_hashes:
-            score = text_scores.get(hash, 1.0)  # Default score for tag/date only matches
-            results.append((hash, score))
-        
-        # Sort by score and return
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:limit]
+        # Tag/date-only matches all score 1.0
+        return [(hash, 1.0) for hash in list(candidate_hashes)[:limit]]
     
     def rebuild_indexes(self, memories: List[MemoryEntry]):
         """Rebuild all indexes from scratch."""
@@ -498,16 +563,20 @@ class IndexManager:
         
         self.date_index.date_to_memories.clear()
         self.date_index.memory_to_date.clear()
+        self._signatures.clear()
         
         # Add all memories
         for memory in memories:
             self.add_memory(memory)
+        self._synced = True
+        self.dirty = True
     
     def save_all_indexes(self):
         """Save all indexes to disk."""
         self.search_index.save_index()
         self.tag_index.save_index()
         self.date_index.save_index()
+        self.dirty = False
     
     def get_combined_stats(self) -> Dict:
         """Get statistics from all indexes."""
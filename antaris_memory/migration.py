@@ -16,7 +16,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from .entry import MemoryEntry
-from .sharding import ShardManager
+from .sharding import SHARD_FILE_SUFFIXES, ShardManager
 
 
 class MigrationError(Exception):
@@ -305,8 +305,15 @@ class MigrationManager:
                 for shard_info in index_data.get("shards", []):
                     filename = shard_info.get("filename")
                     if filename:
-                        shard_path = os.path.join(shards_dir, filename)
-                        if not os.path.exists(shard_path):
+                        # The index names the plain .json file; the shard
+                        # may be stored in any format (e.g. .json.gz)
+                        stem = filename
+                        for suffix in sorted(SHARD_FILE_SUFFIXES, key=len, reverse=True):
+                            if filename.endswith(suffix):
+                                stem = filename[:-len(suffix)]
+                                break
+                        if not any(os.path.exists(os.path.join(shards_dir, stem + suffix))
+                                   for suffix in SHARD_FILE_SUFFIXES):
                             issues.append(f"Missing shard file: {filename}")
             
         except json.JSONDecodeError:
@@ -208,6 +208,9 @@ class NamespacedMemory:
     def ingest_file(self, file_path: str, category: str = "tactical") -> int:
         return self._system.ingest_file(file_path, category)
 
+    def ingest_many(self, paths, category: str = "tactical") -> int:
+        return self._system.ingest_many(paths, category)
+
     def ingest_directory(self, dir_path: str, category: str = "tactical",
                          pattern: str = "*.md") -> int:
         return self._system.ingest_directory(dir_path, category, pattern)
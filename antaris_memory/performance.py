@@ -17,6 +17,8 @@ from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+from .utils import append_jsonl, extend_jsonl
+
 # ─────────────────────────────────────────────────────────────────────────────
 # LRU Read Cache
 # ─────────────────────────────────────────────────────────────────────────────
@@ -108,6 +110,8 @@ class WALManager:
             ``{workspace}/.wal/pending.jsonl``.
         flush_interval: Number of appends before auto-flush is signalled.
         max_size_bytes: WAL file size that also triggers auto-flush.
+        filename: WAL file name inside ``.wal/`` (default
+            ``pending.jsonl``); lets several stores share a directory.
     """
 
     WAL_DIR = ".wal"
@@ -118,10 +122,11 @@ class WALManager:
         workspace: str,
         flush_interval: int = 50,
         max_size_bytes: int = 1_000_000,
+        filename: str = None,
     ):
         self.workspace = workspace
         self.wal_dir = os.path.join(workspace, self.WAL_DIR)
-        self.wal_path = os.path.join(self.wal_dir, self.WAL_FILENAME)
+        self.wal_path = os.path.join(self.wal_dir, filename or self.WAL_FILENAME)
         self.flush_interval = flush_interval
         self.max_size_bytes = max_size_bytes
         self._write_count = 0   # writes since last clear
@@ -132,11 +137,16 @@ class WALManager:
 
     def append(self, entry_dict: Dict) -> None:
         """Atomically append one entry dict as a JSON line."""
-        line = json.dumps(entry_dict, ensure_ascii=False) + "\n"
-        with open(self.wal_path, "a", encoding="utf-8") as fh:
-            fh.write(line)
+        # No fsync: the WAL protects against process crashes, which the
+        # page cache survives; compaction fsyncs the shards.
+        append_jsonl(self.wal_path, entry_dict, fsync=False)
         self._write_count += 1
 
+    def append_many(self, entry_dicts: List[Dict]) -> None:
+        """Append several entry dicts with a single write."""
+        extend_jsonl(self.wal_path, entry_dicts, fsync=False)
+        self._write_count += len(entry_dicts)
+
     # ── read path (replay) ───────────────────────────────────────────────
 
     def load_pending(self) -> List[Dict]:
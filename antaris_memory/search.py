@@ -11,13 +11,29 @@ Provides ranked search with BM25-inspired scoring, combining:
 All deterministic, zero dependencies.
 """
 
+import heapq
 import math
 import re
 from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 
+@lru_cache(maxsize=256)
+def _term_matcher(terms: Tuple[str, ...]) -> "re.Pattern":
+    """Compiled matcher for whole tokens equal to any of ``terms``.
+    
+    ``SearchEngine._tokenize`` yields maximal runs of 2+ word characters,
+    so a term occurs as a token exactly where it matches with no word
+    character on either side. One ``findall`` over the lowercased content
+    then gives a query's term frequencies without tokenizing the entry.
+    Cached per query, so repeated searches reuse the compiled pattern.
+    """
+    return re.compile(r"(?<!\w)(?:%s)(?!\w)" % "|".join(map(re.escape, terms)))
+
+
 @dataclass
 class SearchResult:
     """A search result with relevance score and explanation."""
@@ -76,12 +92,24 @@ class SearchEngine:
         'up', 'down', 'we', 'our', 'you', 'your', 'my', 'me', 'i',
     })
     
+    # Score multipliers applied by _score_entry (each at most once per entry)
+    PHRASE_BOOST = 1.5
+    TAG_BOOST = 1.2
+    SOURCE_BOOST = 1.1
+    MAX_BOOST = PHRASE_BOOST * TAG_BOOST * SOURCE_BOOST
+    
+    _TOKEN_RE = re.compile(r'\w{2,}')
+    # Tags and sources are often snake_case ("meeting_notes"), so field
+    # tokens also include the underscore-separated parts.
+    _FIELD_PART_RE = re.compile(r'[^\W_]{2,}')
+    
     def __init__(self, k1: float = 1.5, b: float = 0.75):
         self.k1 = k1
         self.b = b
-        self._idf_cache: Dict[str, float] = {}
+        self._idf_cache: Dict[str, float] = {}  # filled lazily by _idf()
         self._avg_doc_len: float = 0
         self._doc_count: int = 0
+        self._total_len: int = 0  # sum of document lengths
         self._doc_freqs: Counter = Counter()  # term → number of docs containing it
         self._corpus_version: int = 0
         self._indexed_version: int = -1
@@ -89,6 +117,16 @@ class SearchEngine:
         # Detects in-place content mutations that don't change the memory count
         # (e.g. tag updates, content edits) — fixes search index drift (Gemini review).
         self._content_fingerprint: int = 0
+        # Tag/source text → token set; fields repeat heavily across entries.
+        self._field_token_cache: Dict[str, frozenset] = {}
+        # Inverted index: term → contents containing it. Keyed by content
+        # (not entry identity) so reloaded/copied entries still resolve.
+        self._postings: Dict[str, set] = {}
+        # Indexed content → its token count (BM25 document length)
+        self._doc_lens: Dict[str, int] = {}
+        # Indexed content → its positions in the indexed memory list, so a
+        # query can visit just the entries on its posting lists
+        self._positions: Dict[str, List[int]] = {}
 
     @staticmethod
     def _compute_fingerprint(memories: list) -> int:
@@ -106,25 +144,131 @@ class SearchEngine:
         self._indexed_version = self._corpus_version
         self._content_fingerprint = self._compute_fingerprint(memories)
         self._doc_count = len(memories)
-        self._doc_freqs.clear()
-        self._idf_cache.clear()
         
+        # Plain dict + bound get is cheaper per increment than Counter
+        doc_freqs: Dict[str, int] = {}
+        df_get = doc_freqs.get
+        postings: Dict[str, set] = {}
+        postings_get = postings.get
+        doc_lens: Dict[str, int] = {}
+        positions: Dict[str, List[int]] = {}
+        positions_get = positions.get
+        tokenize = self._tokenize
         total_len = 0
-        for mem in memories:
-            tokens = self._tokenize(mem.content)
+        for pos, mem in enumerate(memories):
+            content = mem.content
+            tokens = tokenize(content)
             total_len += len(tokens)
+            doc_lens[content] = len(tokens)
+            at = positions_get(content)
+            if at is None:
+                positions[content] = [pos]
+            else:
+                at.append(pos)
             # Count unique terms per document
             for term in set(tokens):
-                self._doc_freqs[term] += 1
+                doc_freqs[term] = df_get(term, 0) + 1
+                docs = postings_get(term)
+                if docs is None:
+                    postings[term] = {content}
+                else:
+                    docs.add(content)
+        self._postings = postings
+        self._doc_lens = doc_lens
+        self._positions = positions
         
+        self._total_len = total_len
         self._avg_doc_len = total_len / max(self._doc_count, 1)
+        self._field_token_cache.clear()
+        self._idf_cache = {}
+        self._doc_freqs = Counter(doc_freqs)  # stats() uses most_common()
+    
+    def add_documents(self, memories: list) -> None:
+        """Add newly appended ``memories`` to an up-to-date index.
+        
+        Tokenizes only these entries and updates document frequencies,
+        postings and lengths in place, leaving the index exactly as
+        ``build_index`` would for the grown corpus. Does nothing while the
+        index is stale (``mark_dirty``), since the next search rebuilds it.
+        """
+        if not memories or self._indexed_version != self._corpus_version:
+            return
+        doc_freqs = self._doc_freqs
+        postings = self._postings
+        postings_get = postings.get
+        doc_lens = self._doc_lens
+        positions = self._positions
+        tokenize = self._tokenize
+        fingerprint = self._content_fingerprint
+        # New entries are appended to the end of the indexed list
+        for pos, mem in enumerate(memories, self._doc_count):
+            content = mem.content
+            tokens = tokenize(content)
+            self._total_len += len(tokens)
+            doc_lens[content] = len(tokens)
+            positions.setdefault(content, []).append(pos)
+            fingerprint ^= hash(content)
+            for term in set(tokens):
+                doc_freqs[term] += 1
+                docs = postings_get(term)
+                if docs is None:
+                    postings[term] = {content}
+                else:
+                    docs.add(content)
+        self._content_fingerprint = fingerprint
+        self._doc_count += len(memories)
+        self._avg_doc_len = self._total_len / max(self._doc_count, 1)
+        self._idf_cache.clear()  # every IDF depends on the document count
+    
+    def _idf(self, term: str) -> float:
+        """BM25 IDF (with smoothing) of ``term``; 1.0 for unindexed terms."""
+        idf = self._idf_cache.get(term)
+        if idf is None:
+            df = self._doc_freqs.get(term)
+            if df is None:
+                return 1.0
+            n = self._doc_count
+            idf = self._idf_cache[term] = math.log((n - df + 0.5) / (df + 0.5) + 1.0)
+        return idf
+    
+    def term_upper_bounds(self, memories: list) -> Dict[str, float]:
+        """Return each term's largest BM25 contribution over ``memories``.
+        
+        For every term, the maximum ``idf * tf_norm`` that any single entry
+        earns, with IDF and average length taken from ``memories`` itself.
+        Any entry's score for a query is at most the sum of these bounds
+        over the query terms, times ``MAX_BOOST``. Used for shard pruning.
+        """
+        tokenize = self._tokenize
+        docs = []
+        doc_freqs: Dict[str, int] = {}
+        df_get = doc_freqs.get
+        total_len = 0
+        for mem in memories:
+            tokens = tokenize(mem.content)
+            total_len += len(tokens)
+            tf = Counter(tokens)
+            docs.append((len(tokens), tf))
+            for term in tf:
+                doc_freqs[term] = df_get(term, 0) + 1
+        
+        n = len(docs)
+        avg_len = max(total_len / max(n, 1), 1)
+        k1, b = self.k1, self.b
+        best: Dict[str, float] = {}
+        best_get = best.get
+        for doc_len, tf_counter in docs:
+            norm = k1 * (1 - b + b * doc_len / avg_len)
+            for term, tf in tf_counter.items():
+                tf_norm = (tf * (k1 + 1)) / (tf + norm)
+                if tf_norm > best_get(term, 0.0):
+                    best[term] = tf_norm
         
-        # Pre-compute IDF for all terms
-        for term, df in self._doc_freqs.items():
-            # BM25 IDF formula with smoothing
-            self._idf_cache[term] = math.log(
-                (self._doc_count - df + 0.5) / (df + 0.5) + 1.0
-            )
+        log = math.log
+        return {
+            term: log((n - doc_freqs[term] + 0.5) / (doc_freqs[term] + 0.5) + 1.0) * tf_norm
+            for term, tf_norm in best.items()
+        }
     
     def search(self, query: str, memories: list, limit: int = 20,
                category: str = None, min_score: float = 0.01,
@@ -154,14 +298,35 @@ class SearchEngine:
                 or self._content_fingerprint != current_fp):
             self.build_index(memories)
         
-        results = []
-        max_score = 0.0
+        query_lower = query.lower()
+        # Each unique term is scored once, weighted by its query multiplicity
+        query_counts = Counter(query_tokens)
         
-        for mem in memories:
+        # Only entries containing a query term can score above zero (field
+        # boosts multiply the content score), so indexed entries missing
+        # from every query term's posting list are skipped unscored.
+        postings = self._postings
+        indexed = self._doc_lens
+        candidates: set = set()
+        for term in query_counts:
+            docs = postings.get(term)
+            if docs:
+                candidates = candidates | docs if candidates else docs
+        matcher = _term_matcher(tuple(query_counts))
+        
+        pool = self._entries_at(memories, candidates)
+        if pool is None:  # list no longer laid out as indexed: scan it
+            pool = [mem for mem in memories
+                    if mem.content in candidates or mem.content not in indexed]
+        
+        scored = []
+        
+        for mem in pool:
             if category and mem.category != category:
                 continue
             
-            score, matched = self._score_entry(mem, query_tokens, query.lower())
+            score, matched = self._score_entry(mem, query_tokens, query_lower,
+                                               query_counts, matcher)
             
             if score <= 0:
                 continue
@@ -171,93 +336,138 @@ class SearchEngine:
                 decay_score = decay_fn(mem)
                 score *= (0.3 + 0.7 * decay_score)  # Decay modulates 30-100% of score
             
-            max_score = max(max_score, score)
-            results.append((mem, score, matched))
+            scored.append((mem, score, matched))
         
-        # Normalize scores to 0-1 range
-        if max_score > 0:
-            normalized = []
-            for mem, score, matched in results:
-                relevance = score / max_score
-                if relevance < min_score:
-                    continue
-                
-                explanation = self._explain(matched, score, relevance)
-                normalized.append(SearchResult(
-                    entry=mem,
-                    score=score,
-                    relevance=round(relevance, 4),
-                    matched_terms=matched,
-                    explanation=explanation,
-                ))
-            results = normalized
-        else:
+        # Top-k selection (stable, like a full sort) — SearchResult objects
+        # are only built for entries that can actually be returned.
+        top = heapq.nlargest(limit, scored, key=itemgetter(1))
+        if not top or top[0][1] <= 0:
             return []
+        max_score = top[0][1]
         
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results[:limit]
+        # Normalize scores to 0-1 range
+        results = []
+        for mem, score, matched in top:
+            relevance = score / max_score
+            if relevance < min_score:
+                break  # descending order: everything after scores lower
+            
+            explanation = self._explain(matched, score, relevance)
+            results.append(SearchResult(
+                entry=mem,
+                score=score,
+                relevance=round(relevance, 4),
+                matched_terms=matched,
+                explanation=explanation,
+            ))
+        return results
     
-    def _score_entry(self, mem, query_tokens: List[str], query_lower: str) -> Tuple[float, List[str]]:
-        """Score a single memory against query tokens."""
-        content_lower = mem.content.lower()
-        content_tokens = self._tokenize(mem.content)
-        doc_len = len(content_tokens)
+    def _entries_at(self, memories: list, contents: set) -> Optional[list]:
+        """Entries of ``memories`` holding ``contents``, in list order.
         
-        # Count term frequencies in this document
-        tf_counter = Counter(content_tokens)
+        Looks them up by the positions recorded at index time instead of
+        scanning the list. Returns None if an entry there no longer has the
+        recorded content (e.g. the list was reordered).
+        """
+        positions = self._positions
+        hits = sorted((pos, content) for content in contents
+                      for pos in positions.get(content, ()))
+        n = len(memories)
+        entries = []
+        for pos, content in hits:
+            if pos >= n or memories[pos].content != content:
+                return None
+            entries.append(memories[pos])
+        return entries
+    
+    def _score_entry(self, mem, query_tokens: List[str], query_lower: str,
+                     query_counts: Optional[Counter] = None,
+                     matcher: Optional["re.Pattern"] = None) -> Tuple[float, List[str]]:
+        """Score a single memory against query tokens.
+        
+        ``query_counts`` is the multiset of ``query_tokens`` and ``matcher``
+        its ``_term_matcher``; pass them when scoring many entries for the
+        same query. With a matcher, indexed entries are not re-tokenized
+        unless the phrase check needs their tokens.
+        """
+        if query_counts is None:
+            query_counts = Counter(query_tokens)
+        content = mem.content
+        content_lower = content.lower()
+        content_tokens = None
+        doc_len = self._doc_lens.get(content) if matcher is not None else None
+        
+        # Term frequencies in this document
+        if doc_len is not None:
+            # Only query terms are matched, so the list is short
+            tf_of = matcher.findall(content_lower).count
+        else:
+            content_tokens = self._tokenize(content)
+            doc_len = len(content_tokens)
+            tf_of = Counter(content_tokens).__getitem__
         
         score = 0.0
         matched = []
+        # BM25 length normalization, the same for every term of this document
+        norm = self.k1 * (1 - self.b + self.b * doc_len / max(self._avg_doc_len, 1))
         
-        # BM25 scoring per query term
-        for term in query_tokens:
-            tf = tf_counter.get(term, 0)
+        # BM25 scoring per unique query term (repeats weighted by count)
+        for term, qc in query_counts.items():
+            tf = tf_of(term)
             if tf == 0:
                 continue
             
             matched.append(term)
-            idf = self._idf_cache.get(term, 1.0)
+            idf = self._idf(term)
             
             # BM25 TF component with length normalization
-            tf_norm = (tf * (self.k1 + 1)) / (
-                tf + self.k1 * (1 - self.b + self.b * doc_len / max(self._avg_doc_len, 1))
-            )
+            tf_norm = (tf * (self.k1 + 1)) / (tf + norm)
             
-            score += idf * tf_norm
+            score += idf * tf_norm * qc
         
-        # Exact phrase bonus (query tokens appear consecutively in content tokens)
-        if len(query_tokens) > 1:
+        # Exact phrase bonus (query tokens appear consecutively in content tokens).
+        # Each query token must then occur in the content, which is a cheap
+        # substring test to run before tokenizing.
+        if len(query_tokens) > 1 and all(t in content_lower for t in query_counts):
+            if content_tokens is None:
+                content_tokens = self._tokenize(content)
             content_token_str = " ".join(content_tokens)
             query_token_str = " ".join(query_tokens)
             if query_token_str in content_token_str:
-                score *= 1.5
+                score *= self.PHRASE_BOOST
         
         # Field boosting: check tags (at most one 1.2x boost per entry)
         if hasattr(mem, 'tags') and mem.tags:
-            tag_text = " ".join(mem.tags).lower()
-            tag_hit = False
-            for term in query_tokens:
-                if term in tag_text:
-                    if not tag_hit:
-                        score *= 1.2
-                        tag_hit = True
-                    if term not in matched:
+            tag_hits = self._field_tokens(" ".join(mem.tags)).intersection(query_counts)
+            if tag_hits:
+                score *= self.TAG_BOOST
+                content_matched = set(matched)
+                for term in query_counts:
+                    if term in tag_hits and term not in content_matched:
                         matched.append(f"tag:{term}")
         
         # Field boosting: check source (at most one 1.1x boost per entry)
         if hasattr(mem, 'source') and mem.source:
-            source_lower = mem.source.lower()
-            for term in query_tokens:
-                if term in source_lower:
-                    score *= 1.1
-                    break
+            if not self._field_tokens(mem.source).isdisjoint(query_counts):
+                score *= self.SOURCE_BOOST
         
         return score, matched
     
     def _tokenize(self, text: str) -> List[str]:
         """Tokenize text into lowercase terms, filtering stopwords."""
-        tokens = re.findall(r'\w{2,}', text.lower())
-        return [t for t in tokens if t not in self.STOPWORDS and not (t.isdigit() and len(t) < 3)]
+        stopwords = self.STOPWORDS
+        return [t for t in self._TOKEN_RE.findall(text.lower())
+                if t not in stopwords and not (t.isdigit() and len(t) < 3)]
+    
+    def _field_tokens(self, text: str) -> frozenset:
+        """Tokenize a tag/source field for boosting, with caching."""
+        tokens = self._field_token_cache.get(text)
+        if tokens is None:
+            lowered = text.lower()
+            tokens = frozenset(self._TOKEN_RE.findall(lowered))
+            tokens = tokens.union(self._FIELD_PART_RE.findall(lowered))
+            self._field_token_cache[text] = tokens
+        return tokens
     
     def _explain(self, matched: List[str], score: float, relevance: float) -> str:
         """Generate a human-readable explanation of the score."""
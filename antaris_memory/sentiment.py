@@ -2,6 +2,11 @@
 
 from typing import Dict, Optional
 
+try:  # optional accelerator: pip install pyahocorasick
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 SENTIMENT_KEYWORDS: Dict[str, list] = {
     "positive": [
         "achieved", "breakthrough", "complete", "success", "excellent", "great",
@@ -33,22 +38,85 @@ SENTIMENT_KEYWORDS: Dict[str, list] = {
 }
 
 
+def _keyword_slots(keywords: Dict[str, list]) -> Dict[str, list]:
+    """Map each lowered keyword to the ``(label, index)`` slots it fills.
+
+    A keyword shared between labels (e.g. "profit") is matched once and
+    counted for each label that lists it.
+    """
+    slots: Dict[str, list] = {}
+    for label, kws in keywords.items():
+        for i, kw in enumerate(kws):
+            kw_lower = kw.lower()
+            if kw_lower:
+                slots.setdefault(kw_lower, []).append((label, i))
+    return slots
+
+
+def _build_automaton(slots: Dict[str, list]):
+    """Compile all keywords into one Aho–Corasick automaton.
+
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None or not slots:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw_lower, kw_slots in slots.items():
+        automaton.add_word(kw_lower, kw_slots)
+    automaton.make_automaton()
+    return automaton
+
+
+# (slots, automaton) for SENTIMENT_KEYWORDS, built by the first tagger that
+# uses the default map and shared (read-only) by all later ones
+_default_matcher = None
+
+
+def _matcher_for(keywords: Dict[str, list]):
+    global _default_matcher
+    if keywords is not SENTIMENT_KEYWORDS:
+        slots = _keyword_slots(keywords)
+        return slots, _build_automaton(slots)
+    if _default_matcher is None:
+        slots = _keyword_slots(keywords)
+        _default_matcher = (slots, _build_automaton(slots))
+    return _default_matcher
+
+
 class SentimentTagger:
     """Lightweight keyword-based sentiment analysis.
 
     No external dependencies. Upgrade path: swap in a transformer model
     or OpenAI call for production-grade analysis.
+
+    When ``pyahocorasick`` is installed, keyword matching is a single
+    linear pass over the text instead of one substring scan per keyword.
     """
 
     def __init__(self, keywords: Dict[str, list] = None):
         self.keywords = keywords or SENTIMENT_KEYWORDS
+        self._slots, self._automaton = _matcher_for(self.keywords)
 
     def analyze(self, text: str) -> Dict[str, float]:
         """Return {label: score} for each detected sentiment."""
         text_lower = text.lower()
+        seen = set()
+        if self._automaton is not None:
+            for _end, kw_slots in self._automaton.iter(text_lower):
+                seen.update(kw_slots)
+        else:
+            # Each distinct lowered keyword is tested once, however many
+            # labels list it
+            for kw_lower, kw_slots in self._slots.items():
+                if kw_lower in text_lower:
+                    seen.update(kw_slots)
+        counts: Dict[str, int] = {}
+        for label, _index in seen:
+            counts[label] = counts.get(label, 0) + 1
+        # Preserve keyword-map label order in the result
         scores: Dict[str, float] = {}
-        for label, kws in self.keywords.items():
-            hits = sum(1 for kw in kws if kw.lower() in text_lower)
+        for label in self.keywords:
+            hits = counts.get(label)
             if hits:
                 scores[label] = round(min(hits / 3.0, 1.0), 2)
         return scores
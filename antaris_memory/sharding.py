@@ -11,23 +11,53 @@ Benefits:
 - Easier backup/archival (archive old date shards)
 """
 
+import gzip
+import heapq
 import json
 import os
 import re
-from collections import defaultdict
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 
 from .entry import MemoryEntry
+from .search import SearchEngine
 
 
-class ShardKey:
-    """Represents a unique shard identifier."""
+# Shard files on disk: plain JSON, or gzip'd compact JSON (compress=True)
+SHARD_FILE_SUFFIXES = (".json", ".json.gz")
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+@lru_cache(maxsize=1024)
+def _topic_for(category: str, tags: Tuple[str, ...]) -> str:
+    """Determine a shard topic from category and tags.
+
+    Cached: most memories in a corpus share a handful of category/tag
+    combinations.
+    """
+    if category and category != "general":
+        return category.lower()
+    # Use the first meaningful tag as topic
+    for tag in tags:
+        if len(tag) > 2 and not tag.startswith("@"):
+            return tag.lower()
+    return "general"
+
+
+class ShardKey(NamedTuple):
+    """Represents a unique shard identifier.
+
+    A NamedTuple, so hashing and equality are C-level tuple operations.
+    """
     
-    def __init__(self, date_key: str, topic_key: str = "general"):
-        self.date_key = date_key  # YYYY-MM format
-        self.topic_key = topic_key  # topic category
+    date_key: str  # YYYY-MM format
+    topic_key: str = "general"  # topic category
     
     @property 
     def filename(self) -> str:
@@ -36,40 +66,72 @@ class ShardKey:
     
     def __str__(self) -> str:
         return f"{self.date_key}:{self.topic_key}"
-    
-    def __hash__(self) -> int:
-        return hash((self.date_key, self.topic_key))
-    
-    def __eq__(self, other) -> bool:
-        return (self.date_key, self.topic_key) == (other.date_key, other.topic_key)
 
 
 class ShardIndex:
     """Tracks which memories are in which shards."""
     
+    TERM_BOUND_TOP_N = 50  # terms per shard with an exact score bound
+    
     def __init__(self, workspace: str):
         self.workspace = workspace
         self.index_path = os.path.join(workspace, "memory_index.json")
         self.shards: Dict[ShardKey, Dict] = {}  # shard_key -> metadata
+        # Parallel arrays (one slot per shard) scanned by find_relevant_shards,
+        # with topics pre-lowered so queries don't re-lowercase every call.
+        self._shard_pos: Dict[ShardKey, int] = {}
+        self._shard_keys: List[ShardKey] = []
+        self._shard_date: List[str] = []
+        self._shard_topic_lower: List[frozenset] = []
+        # Inverted index: lowered topic -> positions of shards carrying it
+        self._topic_postings: Dict[str, Set[int]] = defaultdict(set)
+        self._general_positions: Set[int] = set()
+        # shard_key -> (contents tuple, term_max, term_floor) from the last
+        # add_shard, so re-saving an unchanged shard skips re-tokenizing it
+        self._bounds_cache: Dict[ShardKey, Tuple[tuple, Dict[str, float], float]] = {}
         self._load_index()
     
+    def _register(self, key: ShardKey, metadata: Dict):
+        """Store shard metadata and keep the parallel lookup arrays in sync."""
+        self.shards[key] = metadata
+        topics_lower = frozenset(t.lower() for t in metadata["topics"])
+        pos = self._shard_pos.get(key)
+        if pos is None:
+            pos = len(self._shard_keys)
+            self._shard_pos[key] = pos
+            self._shard_keys.append(key)
+            self._shard_date.append(key.date_key)
+            self._shard_topic_lower.append(topics_lower)
+            if key.topic_key == "general":
+                self._general_positions.add(pos)
+        else:
+            for topic in self._shard_topic_lower[pos] - topics_lower:
+                self._topic_postings[topic].discard(pos)
+            self._shard_topic_lower[pos] = topics_lower
+        for topic in topics_lower:
+            self._topic_postings[topic].add(pos)
+    
     def _load_index(self):
         """Load shard index from disk."""
         if not os.path.exists(self.index_path):
             return
         
-        with open(self.index_path) as f:
-            data = json.load(f)
+        from .utils import load_json_bytes
+        with open(self.index_path, "rb") as f:
+            data = load_json_bytes(f.read())
         
         for shard_info in data.get("shards", []):
             key = ShardKey(shard_info["date_key"], shard_info["topic_key"])
-            self.shards[key] = {
+            self._register(key, {
                 "count": shard_info["count"],
                 "first_entry": shard_info["first_entry"],
                 "last_entry": shard_info["last_entry"], 
                 "topics": set(shard_info["topics"]),
-                "size_bytes": shard_info.get("size_bytes", 0)
-            }
+                "size_bytes": shard_info.get("size_bytes", 0),
+                # Absent in pre-3.1 indexes: such shards are never pruned
+                "term_max": shard_info.get("term_max"),
+                "term_floor": shard_info.get("term_floor", 0.0),
+            })
     
     def save_index(self):
         """Save shard index to disk."""
@@ -86,14 +148,16 @@ class ShardIndex:
                     "first_entry": metadata["first_entry"],
                     "last_entry": metadata["last_entry"],
                     "topics": list(metadata["topics"]),
-                    "size_bytes": metadata["size_bytes"]
+                    "size_bytes": metadata["size_bytes"],
+                    "term_max": metadata.get("term_max"),
+                    "term_floor": metadata.get("term_floor", 0.0),
                 }
                 for key, metadata in self.shards.items()
             ]
         }
         
         from .utils import atomic_write_json
-        atomic_write_json(self.index_path, data)
+        atomic_write_json(self.index_path, data, compact=True)
     
     def add_shard(self, key: ShardKey, memories: List[MemoryEntry]):
         """Register a new shard in the index."""
@@ -106,13 +170,47 @@ class ShardIndex:
             if memory.category:
                 topics.add(memory.category)
         
-        self.shards[key] = {
+        # Per-term BM25 upper bounds for shard pruning: the strongest terms
+        # are stored exactly, every other term is bounded by term_floor.
+        # They depend only on the shard's contents.
+        contents = tuple(memory.content for memory in memories)
+        cached = self._bounds_cache.get(key)
+        if cached is not None and cached[0] == contents:
+            _, term_max, term_floor = cached
+        else:
+            bounds = sorted(SearchEngine().term_upper_bounds(memories).items(),
+                            key=itemgetter(1), reverse=True)
+            top_n = self.TERM_BOUND_TOP_N
+            term_max = {t: round(v, 4) for t, v in bounds[:top_n]}
+            term_floor = round(bounds[top_n][1], 4) if len(bounds) > top_n else 0.0
+            self._bounds_cache[key] = (contents, term_max, term_floor)
+        
+        self._register(key, {
             "count": len(memories),
             "first_entry": memories[0].created,
             "last_entry": memories[-1].created,
             "topics": topics,
-            "size_bytes": 0  # Will be calculated when shard is saved
-        }
+            "size_bytes": 0,  # Will be calculated when shard is saved
+            "term_max": term_max,
+            "term_floor": term_floor,
+        })
+    
+    def upper_bound(self, key: ShardKey, query_counts: Dict[str, int]) -> float:
+        """Upper bound on any entry's SearchEngine score in a shard.
+        
+        ``query_counts`` maps query tokens to their multiplicity. Returns
+        ``inf`` for shards indexed before bounds were recorded.
+        """
+        metadata = self.shards[key]
+        term_max = metadata.get("term_max")
+        if term_max is None:
+            return float("inf")
+        floor = metadata.get("term_floor", 0.0)
+        # Stored values are rounded to 4 places; pad so the bound stays safe
+        total = sum((term_max.get(t, floor) + 1e-4) * qc
+                    for t, qc in query_counts.items()
+                    if t in term_max or floor)
+        return total * SearchEngine.MAX_BOOST
     
     def find_relevant_shards(self, 
                            query: str, 
@@ -125,24 +223,36 @@ class ShardIndex:
         query_lower = query.lower()
         query_words = set(re.findall(r'\w{3,}', query_lower))
         
-        for key, metadata in self.shards.items():
-            # Date filtering
-            if date_range:
-                start_date, end_date = date_range
-                if key.date_key < start_date[:7] or key.date_key > end_date[:7]:
-                    continue
+        if date_range:
+            start_month, end_month = date_range[0][:7], date_range[1][:7]
+        topic_lower = topic_filter.lower() if topic_filter else None
+        keys = self._shard_keys
+        dates = self._shard_date
+        
+        if query_words:
+            # Query relevance - shards whose topics match any query word,
+            # plus general shards, straight from the posting lists
+            postings = self._topic_postings
+            candidates = set(self._general_positions)
+            for word in query_words:
+                hits = postings.get(word)
+                if hits:
+                    candidates |= hits
+        else:
+            # No usable query words: every shard is a candidate
+            candidates = range(len(keys))
+        
+        for i in candidates:
+            # Date filtering (cheapest check first)
+            if date_range and (dates[i] < start_month or dates[i] > end_month):
+                continue
             
+            key = keys[i]
             # Topic filtering  
-            if topic_filter and topic_filter.lower() not in key.topic_key.lower():
+            if topic_lower and topic_lower not in key.topic_key.lower():
                 continue
             
-            # Query relevance - check if any query words match shard topics
-            shard_topics = {t.lower() for t in metadata["topics"]}
-            if query_words & shard_topics:
-                relevant.append(key)
-            # Also include general shards and date-matching shards
-            elif key.topic_key == "general" or len(query_words) == 0:
-                relevant.append(key)
+            relevant.append(key)
         
         # Sort by date (newest first) and topic relevance
         relevant.sort(key=lambda k: (k.date_key, k.topic_key), reverse=True)
@@ -173,35 +283,38 @@ class ShardIndex:
 class ShardManager:
     """Manages memory sharding and retrieval."""
     
-    def __init__(self, workspace: str):
+    MAX_CACHED_SHARDS = 10  # Keep max 10 shards in memory
+    LOAD_WORKERS = 8  # Threads used by load_shards
+    
+    def __init__(self, workspace: str, compress: bool = False):
+        """
+        Args:
+            workspace: Root directory; shards live in ``{workspace}/shards``.
+            compress: Write shards as gzip'd JSON (``.json.gz``) instead of
+                plain JSON. Either format is read.
+        """
         self.workspace = workspace
+        self.compress = compress
         self.shards_dir = os.path.join(workspace, "shards")
         os.makedirs(self.shards_dir, exist_ok=True)
         
         self.index = ShardIndex(workspace)
-        self._shard_cache: Dict[ShardKey, List[MemoryEntry]] = {}
+        # LRU of loaded shards: most recently used at the end
+        self._shard_cache: "OrderedDict[ShardKey, List[MemoryEntry]]" = OrderedDict()
+        # Guards _shard_cache: load_shards loads shards from worker threads
+        self._cache_lock = threading.Lock()
     
     def create_shard_key(self, memory: MemoryEntry) -> ShardKey:
         """Determine which shard a memory belongs to."""
         # Extract date (YYYY-MM format)
         date_key = memory.created[:7]  # "2026-02-15" -> "2026-02"
-        
-        # Determine topic based on category and tags
-        topic_key = "general"
-        
-        if memory.category and memory.category != "general":
-            topic_key = memory.category.lower()
-        elif memory.tags:
-            # Use the first meaningful tag as topic
-            meaningful_tags = [t for t in memory.tags if len(t) > 2 and not t.startswith("@")]
-            if meaningful_tags:
-                topic_key = meaningful_tags[0].lower()
-        
-        return ShardKey(date_key, topic_key)
+        return ShardKey(date_key, _topic_for(memory.category, tuple(memory.tags)))
     
     def save_shard(self, key: ShardKey, memories: List[MemoryEntry]) -> str:
         """Save a shard to disk."""
-        shard_path = os.path.join(self.shards_dir, key.filename)
+        plain_path = os.path.join(self.shards_dir, key.filename)
+        gz_path = plain_path + ".gz"
+        shard_path, stale_path = (gz_path, plain_path) if self.compress else (plain_path, gz_path)
         
         data = {
             "shard_key": str(key),
@@ -213,40 +326,67 @@ class ShardManager:
             "memories": [m.to_dict() for m in memories]
         }
         
-        from .utils import atomic_write_json
-        atomic_write_json(shard_path, data)
-        
-        # Update index with actual file size
-        file_size = os.path.getsize(shard_path)
+        from .utils import atomic_write_json, dump_json_bytes, remove_file
+        # Compact JSON: shards are machine-read, and indentation roughly
+        # doubles the encode time and adds ~30% to the file size
+        payload = dump_json_bytes(data, indent=None)
+        if self.compress:
+            # gzip level 3: most of the size win for little CPU
+            payload = gzip.compress(payload, compresslevel=3, mtime=0)
+        atomic_write_json(shard_path, payload)
+        
+        # Drop the copy in the other format so loads never see stale data
+        # (after the new file is in place, also inside batch_writes())
+        remove_file(stale_path)
+        
+        # Update index with the file size (the payload is written verbatim,
+        # and inside batch_writes() the file is not in place yet)
         if key in self.index.shards:
-            self.index.shards[key]["size_bytes"] = file_size
+            self.index.shards[key]["size_bytes"] = len(payload)
         
         return shard_path
     
     def load_shard(self, key: ShardKey) -> List[MemoryEntry]:
         """Load memories from a shard."""
-        # Check cache first
-        if key in self._shard_cache:
-            return self._shard_cache[key]
-        
-        shard_path = os.path.join(self.shards_dir, key.filename)
-        if not os.path.exists(shard_path):
+        # Check cache first (and mark as most recently used)
+        with self._cache_lock:
+            if key in self._shard_cache:
+                self._shard_cache.move_to_end(key)
+                return self._shard_cache[key]
+        
+        plain_path = os.path.join(self.shards_dir, key.filename)
+        candidates = (plain_path + ".gz", plain_path) if self.compress else (plain_path, plain_path + ".gz")
+        shard_path = next((p for p in candidates if os.path.exists(p)), None)
+        if shard_path is None:
             return []
         
-        with open(shard_path) as f:
-            data = json.load(f)
+        from .utils import load_json_bytes
+        with open(shard_path, "rb") as f:
+            raw = f.read()
+        if raw[:2] == _GZIP_MAGIC:
+            raw = gzip.decompress(raw)
+        data = load_json_bytes(raw)
         
         memories = [MemoryEntry.from_dict(m) for m in data.get("memories", [])]
         
-        # Cache the loaded shard (but limit cache size)
-        if len(self._shard_cache) > 10:  # Keep max 10 shards in memory
-            # Remove oldest cache entry
-            oldest_key = next(iter(self._shard_cache))
-            del self._shard_cache[oldest_key]
-        
-        self._shard_cache[key] = memories
+        # Cache the loaded shard, evicting the least recently used
+        with self._cache_lock:
+            self._shard_cache[key] = memories
+            if len(self._shard_cache) > self.MAX_CACHED_SHARDS:
+                self._shard_cache.popitem(last=False)
         return memories
     
+    def load_shards(self, keys: List[ShardKey]) -> List[List[MemoryEntry]]:
+        """Load several shards, one list of memories per key in ``keys`` order.
+        
+        Shard reads are I/O-bound, so they are overlapped on a thread pool
+        of up to ``LOAD_WORKERS`` threads.
+        """
+        if len(keys) <= 1:
+            return [self.load_shard(key) for key in keys]
+        with ThreadPoolExecutor(max_workers=min(self.LOAD_WORKERS, len(keys))) as executor:
+            return list(executor.map(self.load_shard, keys))
+    
     def shard_memories(self, memories: List[MemoryEntry]) -> Dict[ShardKey, List[MemoryEntry]]:
         """Split memories into shards."""
         shards = defaultdict(list)
@@ -261,38 +401,76 @@ class ShardManager:
                      query: str,
                      limit: int = 20,
                      date_range: Optional[Tuple[str, str]] = None,
-                     topic_filter: Optional[str] = None) -> List[MemoryEntry]:
-        """Search across relevant shards."""
+                     topic_filter: Optional[str] = None,
+                     max_shards: int = 5) -> List[MemoryEntry]:
+        """Search across relevant shards with BM25 ranking.
+        
+        Candidate shards are visited in order of their score upper bound
+        (see ``ShardIndex.upper_bound``); once ``limit`` results are held,
+        the first shard whose bound cannot beat the weakest of them ends
+        the search, as do ``max_shards`` loaded shards. Scores use each
+        shard's own IDF statistics.
+        """
         # Find which shards to search
         relevant_shards = self.index.find_relevant_shards(query, date_range, topic_filter)
         
+        query_tokens = SearchEngine()._tokenize(query)
+        if not query_tokens:
+            return self._substring_search(query, relevant_shards[:max_shards], limit)
+        query_counts = Counter(query_tokens)
+        
+        # Shards with a zero bound contain no query term at all
+        ranked = []
+        for shard_key in relevant_shards:
+            bound = self.index.upper_bound(shard_key, query_counts)
+            if bound > 0:
+                ranked.append((bound, shard_key))
+        ranked.sort(key=itemgetter(0), reverse=True)
+        
+        top: List[Tuple[float, int, MemoryEntry]] = []  # min-heap of best `limit`
+        seq = 0
+        for bound, shard_key in ranked[:max_shards]:
+            if len(top) >= limit and bound <= top[0][0]:
+                break  # no remaining shard can beat the current k-th best
+            
+            memories = self.load_shard(shard_key)
+            for result in SearchEngine().search(query, memories, limit=limit, min_score=0.0):
+                # Negative sequence: on equal scores, earlier hits win
+                item = (result.score, -seq, result.entry)
+                seq += 1
+                if len(top) < limit:
+                    heapq.heappush(top, item)
+                elif item[:2] > top[0][:2]:
+                    heapq.heapreplace(top, item)
+        
+        top.sort(key=itemgetter(0, 1), reverse=True)
+        return [entry for _score, _seq, entry in top]
+    
+    def _substring_search(self, query: str, shard_keys: List[ShardKey],
+                          limit: int) -> List[MemoryEntry]:
+        """Plain substring match, for queries with no searchable terms."""
         all_results = []
         query_lower = query.lower()
         
-        # Search each relevant shard
-        for shard_key in relevant_shards[:5]:  # Limit to 5 shards max for performance
-            memories = self.load_shard(shard_key)
-            
-            # Simple text matching within shard
-            for memory in memories:
-                content_lower = memory.content.lower()
-                if query_lower in content_lower:
+        for shard_key in shard_keys:
+            for memory in self.load_shard(shard_key):
+                if query_lower in memory.content.lower():
                     all_results.append(memory)
                     if len(all_results) >= limit:
-                        break
-            
-            if len(all_results) >= limit:
-                break
+                        return all_results
         
-        return all_results[:limit]
+        return all_results
     
     def get_all_memories(self, limit: Optional[int] = None) -> List[MemoryEntry]:
         """Load all memories from all shards (use sparingly)."""
         all_memories = []
+        keys = list(self.index.shards.keys())
+        # With a limit, load one pool-width at a time so it can stop early
+        step = self.LOAD_WORKERS if limit else max(len(keys), 1)
         
-        for shard_key in self.index.shards.keys():
-            memories = self.load_shard(shard_key)
-            all_memories.extend(memories)
+        for start in range(0, len(keys), step):
+            for memories in self.load_shards(keys[start:start + step]):
+                all_memories.extend(memories)
             
             if limit and len(all_memories) >= limit:
                 break
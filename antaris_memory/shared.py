@@ -13,14 +13,56 @@ All data stored as JSON files. Zero dependencies.
 
 import json
 import os
+import re
+from collections import Counter, deque
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from .entry import MemoryEntry
 from .decay import DecayEngine
+from .performance import WALManager
 from .search import SearchEngine
 from .sentiment import SentimentTagger
-from .utils import atomic_write_json
+from .temporal import TemporalEngine
+from .utils import append_jsonl, atomic_write_json, dump_json_bytes, load_json_bytes
+
+# Significant words for conflict detection
+_WORD4 = re.compile(r"\w{4,}")
+
+# (negation, affirmation) pairs suggesting contradiction. None means the
+# negation contradicts anything ("not" on its own is a signal).
+_NEGATION_SIGNALS = (
+    ("not", None), ("don'?t", "do"), ("won'?t", "will"),
+    ("can'?t", "can"), ("shouldn'?t", "should"),
+    ("reject", "accept"), ("disagree", "agree"),
+    ("false", "true"), ("wrong", "right"),
+    ("failed", "succeeded"), ("no", "yes"),
+)
+# One alternation, one capture group per token: groups 1..n are the
+# negations, n+1.. the affirmations. Negations come first so "can't"
+# wins over "can".
+_SIGNAL_RE = re.compile(r"\b(?:" + "|".join(
+    [f"({neg})" for neg, _ in _NEGATION_SIGNALS]
+    + [f"({pos})" for _, pos in _NEGATION_SIGNALS if pos]
+) + r")\b")
+_SIGNAL_BITS = [1 << i for i, _ in enumerate(_NEGATION_SIGNALS)]
+_POS_GROUP_BITS = [1 << i for i, (_, pos) in enumerate(_NEGATION_SIGNALS) if pos]
+_ALWAYS_POS = sum(1 << i for i, (_, pos) in enumerate(_NEGATION_SIGNALS)
+                  if pos is None)
+
+
+def _signal_bits(lowered: str) -> Tuple[int, int]:
+    """Return (negation, affirmation) bitmasks for lowered text, one scan."""
+    neg, pos = 0, _ALWAYS_POS
+    n = len(_NEGATION_SIGNALS)
+    for match in _SIGNAL_RE.finditer(lowered):
+        group = match.lastindex - 1
+        if group < n:
+            neg |= _SIGNAL_BITS[group]
+        else:
+            pos |= _POS_GROUP_BITS[group - n]
+    return neg, pos
 
 
 class AgentPermission:
@@ -80,27 +122,52 @@ class SharedMemoryPool:
         Name of the pool (used in filenames).
     """
 
+    AUDIT_KEEP = 500          # audit records kept in memory / after rotation
+    AUDIT_ROTATE_AT = 5000    # rotate the audit file beyond this many lines
+
     def __init__(self, pool_dir: str, pool_name: str = "default"):
         self.pool_dir = os.path.abspath(pool_dir)
         self.pool_name = pool_name
         self.state_path = os.path.join(self.pool_dir,
                                         f"pool_{pool_name}.json")
+        # Audit log is JSONL (append-only, O(1) per action)
         self.audit_path = os.path.join(self.pool_dir,
-                                        f"pool_{pool_name}_audit.json")
+                                        f"pool_{pool_name}_audit.jsonl")
 
         # Internal state
         self.memories: List[MemoryEntry] = []
         self.permissions: Dict[str, AgentPermission] = {}
         self.conflicts: List[Dict] = []
         self._hashes: set = set()
+        # content -> (significant-word set, negation bits, affirmation bits)
+        self._word_cache: Dict[str, Tuple[frozenset, int, int]] = {}
+        # hash -> (namespace, agent); see _owner()
+        self._owners: Dict[str, Tuple[str, Optional[str]]] = {}
         self._decay = DecayEngine(half_life=7.0)
         self._sentiment = SentimentTagger()
+        # Same content from several agents (broadcast / fan-in) is analyzed
+        # once; results are only ever reassigned, so sharing them is safe.
+        self._analyze_sentiment = lru_cache(maxsize=4096)(self._sentiment.analyze)
         # Bug fix: use BM25 SearchEngine for shared pool reads instead of
         # primitive word-overlap, closing the search quality gap vs private memory.
         # Bug fix: BM25 SearchEngine for shared pool reads (auto-rebuilds on corpus change)
         self._search_engine = SearchEngine()
 
         os.makedirs(self.pool_dir, exist_ok=True)
+        # Memory writes are journaled here and compacted into the pool file
+        # by flush()/save(), so a write costs one appended line, not a
+        # rewrite of the whole pool.
+        self._wal = WALManager(self.pool_dir, filename=f"pool_{pool_name}.jsonl")
+        # A flush replaces the pool file and clears the WAL, so writes only
+        # auto-flush once this instance holds everything persisted: nothing
+        # was on disk yet, or after load()/save().
+        self._holds_state = not (os.path.exists(self.state_path)
+                                 or self._wal.exists())
+
+        # Most recent audit records, newest last
+        self._audit_ring: deque = deque(maxlen=self.AUDIT_KEEP)
+        self._audit_lines = 0  # lines in the audit file since last rotation
+        self._load_audit_tail()
 
     # ── agent management ────────────────────────────────────────────────
 
@@ -142,7 +209,9 @@ class SharedMemoryPool:
 
         entry = MemoryEntry(content, source=f"agent:{agent_id}",
                             category=category)
-        entry.sentiment = self._sentiment.analyze(content)
+        if entry.hash in self._hashes:
+            return None  # duplicate: skip sentiment and conflict checks
+        entry.sentiment = self._analyze_sentiment(content)
 
         # Add agent metadata
         if not hasattr(entry, 'metadata'):
@@ -158,13 +227,15 @@ class SharedMemoryPool:
         if conflict:
             self.conflicts.append(conflict)
 
-        if entry.hash not in self._hashes:
-            self.memories.append(entry)
-            self._hashes.add(entry.hash)
-            self._audit("write", agent_id,
-                        f"ns={namespace} hash={entry.hash}")
-            return entry
-        return None
+        self.memories.append(entry)
+        self._hashes.add(entry.hash)
+        self._owners[entry.hash] = (namespace, agent_id)
+        self._index(entry)
+        self._wal.append(entry.to_dict())
+        self._audit("write", agent_id,
+                    f"ns={namespace} hash={entry.hash}")
+        self._maybe_flush()
+        return entry
 
     def read(self, agent_id: str, query: str, namespace: str = None,
              limit: int = 20) -> List[MemoryEntry]:
@@ -179,11 +250,11 @@ class SharedMemoryPool:
             return []
 
         # Filter to accessible memories first
-        accessible = [
-            m for m in self.memories
-            if perm.can_access_namespace(self._get_namespace(m))
-            and (not namespace or self._get_namespace(m) == namespace)
-        ]
+        accessible = []
+        for m in self.memories:
+            ns = self._owner(m)[0]
+            if perm.can_access_namespace(ns) and (not namespace or ns == namespace):
+                accessible.append(m)
 
         if not accessible:
             return []
@@ -204,6 +275,23 @@ class SharedMemoryPool:
         self._audit("read", agent_id, f"query={query[:50]} results={len(scored)}")
         return [m for m, _ in scored[:limit]]
 
+    def on_date(self, agent_id: str, date: str,
+                namespace: str = None) -> List[MemoryEntry]:
+        """Memories created on, or mentioning, ``date``. Respects namespaces.
+
+        Same matching as ``TemporalEngine.on_date``, over the live entries,
+        so edits to ``created`` or ``content`` are always reflected.
+        """
+        perm = self.permissions.get(agent_id)
+        if not perm or not perm.can_read():
+            return []
+        results = []
+        for m in TemporalEngine.on_date(self.memories, date):
+            ns = self._owner(m)[0]
+            if perm.can_access_namespace(ns) and (not namespace or ns == namespace):
+                results.append(m)
+        return results
+
     def propagate(self, from_agent: str, to_namespace: str,
                   query: str = None, limit: int = 10) -> int:
         """Propagate an agent's memories to another namespace.
@@ -216,7 +304,7 @@ class SharedMemoryPool:
 
         # Find memories written by this agent
         agent_memories = [m for m in self.memories
-                          if f"agent:{from_agent}" in m.tags]
+                          if self._owner(m)[1] == from_agent]
 
         if query:
             # Use BM25 SearchEngine for consistent search quality
@@ -234,26 +322,36 @@ class SharedMemoryPool:
                 source=f"propagated:{from_agent}",
                 category=m.category,
             )
-            new_entry.tags = list(m.tags)
-            # Replace namespace tag
-            new_entry.tags = [t for t in new_entry.tags
-                              if not t.startswith("ns:")]
-            new_entry.tags.append(f"ns:{to_namespace}")
-            new_entry.tags.append(f"propagated_from:{from_agent}")
-            new_entry.sentiment = dict(m.sentiment)
+            if new_entry.hash in self._hashes:
+                continue  # already propagated
+
+            # Tags with the namespace replaced, built in one pass
+            new_entry.tags = [t for t in m.tags if not t.startswith("ns:")]
+            new_entry.tags += (f"ns:{to_namespace}", f"propagated_from:{from_agent}")
+            # Sentiment is only ever reassigned, never edited in place,
+            # so the copy can share the source's dict.
+            new_entry.sentiment = m.sentiment
             new_entry.confidence = m.confidence
 
-            if new_entry.hash not in self._hashes:
-                self.memories.append(new_entry)
-                self._hashes.add(new_entry.hash)
-                count += 1
+            self.memories.append(new_entry)
+            self._hashes.add(new_entry.hash)
+            self._owner(new_entry)
+            self._index(new_entry)
+            self._wal.append(new_entry.to_dict())
+            count += 1
 
         self._audit("propagate", from_agent,
                     f"to={to_namespace} count={count}")
+        self._maybe_flush()
         return count
 
     # ── conflict resolution ─────────────────────────────────────────────
 
+    def get_audit_log(self, limit: int = None) -> List[Dict]:
+        """Return recent audit records (oldest first), up to ``AUDIT_KEEP``."""
+        records = list(self._audit_ring)
+        return records[-limit:] if limit else records
+
     def get_conflicts(self) -> List[Dict]:
         """Return unresolved conflicts."""
         return [c for c in self.conflicts if not c.get("resolved")]
@@ -274,8 +372,22 @@ class SharedMemoryPool:
 
     # ── persistence ─────────────────────────────────────────────────────
 
+    def flush(self) -> str:
+        """Compact the write-ahead log into the pool file.
+
+        Called automatically every ``WALManager.flush_interval`` memory
+        writes (or once the WAL exceeds 1 MB), unless the pool file or WAL
+        existed when this instance was created and ``load()`` has not been
+        called: until then, writes are only journaled. Equivalent to
+        ``save()``.
+        """
+        return self.save()
+
     def save(self) -> str:
-        """Save pool state to disk (Bug 3 fix: uses atomic write with FileLock)."""
+        """Save pool state to disk (Bug 3 fix: uses atomic write).
+
+        Writes a full snapshot and then clears the write-ahead log.
+        """
         from . import __version__ as _pkg_version  # Bug fix: add package version
         data = {
             "schema_version": "0.3.0",       # storage format version
@@ -290,128 +402,213 @@ class SharedMemoryPool:
             "memories": [m.to_dict() for m in self.memories],
             "conflicts": self.conflicts,
         }
-        atomic_write_json(self.state_path, data)
+        # Compact JSON (orjson when installed): the pool file is rewritten
+        # in full on every save, so indentation is pure encode + I/O cost.
+        atomic_write_json(self.state_path, dump_json_bytes(data, indent=None))
+        # Snapshot is durable — journaled writes are now redundant
+        self._wal.clear()
+        self._holds_state = True
         return self.state_path
 
     def load(self) -> int:
-        """Load pool state from disk."""
-        if not os.path.exists(self.state_path):
+        """Load pool state from disk, then replay any journaled writes.
+
+        Writes journaled since the last save (e.g. before a crash) are
+        re-applied, so they are not lost.
+        """
+        if os.path.exists(self.state_path):
+            with open(self.state_path, "rb") as f:
+                data = load_json_bytes(f.read())
+        elif self._wal.exists():
+            data = {}
+        else:
+            self._holds_state = True  # nothing persisted to lose
             return 0
-        with open(self.state_path) as f:
-            data = json.load(f)
         self.pool_name = data.get("pool_name", self.pool_name)
         self.permissions = {
             k: AgentPermission.from_dict(v)
             for k, v in data.get("permissions", {}).items()
         }
-        self.memories = [MemoryEntry.from_dict(d)
-                         for d in data.get("memories", [])]
+        # Convert records one at a time, releasing each dict as its entry
+        # is built, so the parsed records and the entries never coexist in
+        # full.
+        records = data.pop("memories", None) or []
+        records.reverse()
+        memories = []
+        while records:
+            memories.append(MemoryEntry.from_dict(records.pop()))
+        self.memories = memories
         self._hashes = {m.hash for m in self.memories}
+        self._word_cache = {}
+        self._owners = {}
+        for m in self.memories:
+            self._owner(m)
+            self._index(m)
         self.conflicts = data.get("conflicts", [])
+        self._replay_wal()
+        self._holds_state = True
         return len(self.memories)
 
     # ── stats ───────────────────────────────────────────────────────────
 
     def stats(self) -> Dict:
         """Pool statistics."""
-        namespaces = {}
-        agents = {}
+        namespaces = Counter()
+        agents = Counter()
         for m in self.memories:
-            ns = self._get_namespace(m)
-            namespaces[ns] = namespaces.get(ns, 0) + 1
-            agent = self._get_agent(m)
+            ns, agent = self._owner(m)
+            namespaces[ns] += 1
             if agent:
-                agents[agent] = agents.get(agent, 0) + 1
+                agents[agent] += 1
 
         return {
             "pool_name": self.pool_name,
             "total_memories": len(self.memories),
             "registered_agents": len(self.permissions),
-            "namespaces": namespaces,
-            "memories_by_agent": agents,
+            "namespaces": dict(namespaces),
+            "memories_by_agent": dict(agents),
             "unresolved_conflicts": len(self.get_conflicts()),
             "total_conflicts": len(self.conflicts),
         }
 
     # ── private ─────────────────────────────────────────────────────────
 
+    def _maybe_flush(self) -> None:
+        """Auto-flush after a journaled write, if due and safe (see flush())."""
+        if self._holds_state and self._wal.should_flush():
+            self.flush()
+
+    def _replay_wal(self) -> int:
+        """Re-apply journaled memory writes missing from the snapshot."""
+        replayed = 0
+        for entry_dict in self._wal.load_pending():
+            try:
+                entry = MemoryEntry.from_dict(entry_dict)
+            except Exception:
+                continue   # corrupted entry — skip
+            if entry.hash in self._hashes:
+                continue   # already in the snapshot (saved before a crash)
+            self.memories.append(entry)
+            self._hashes.add(entry.hash)
+            self._owner(entry)
+            self._index(entry)
+            replayed += 1
+        return replayed
+
     def _check_admin(self, agent_id: str) -> bool:
         perm = self.permissions.get(agent_id)
         return perm and perm.can_admin()
 
     def _get_namespace(self, entry: MemoryEntry) -> str:
-        for tag in entry.tags:
-            if tag.startswith("ns:"):
-                return tag[3:]
-        return "shared"
+        return self._owner(entry)[0]
 
     def _get_agent(self, entry: MemoryEntry) -> Optional[str]:
-        for tag in entry.tags:
-            if tag.startswith("agent:"):
-                return tag[6:]
-        return None
+        return self._owner(entry)[1]
+
+    def _owner(self, entry: MemoryEntry) -> Tuple[str, Optional[str]]:
+        """Return (and cache) an entry's (namespace, agent) from its tags.
+
+        Pool entries are deduplicated by hash, so the hash identifies an
+        entry; the first ``ns:`` / ``agent:`` tag wins, as before.
+        """
+        owner = self._owners.get(entry.hash)
+        if owner is None:
+            ns = agent = None
+            for tag in entry.tags:
+                if ns is None and tag.startswith("ns:"):
+                    ns = tag[3:]
+                elif agent is None and tag.startswith("agent:"):
+                    agent = tag[6:]
+            owner = (ns or "shared", agent)
+            self._owners[entry.hash] = owner
+        return owner
+
+    def _index(self, entry: MemoryEntry) -> Tuple[frozenset, int, int]:
+        """Return (and cache) an entry's word set and negation signal bits.
+
+        Keyed by content, so entries added to ``memories`` directly are
+        picked up lazily and edited content never reuses stale words.
+        """
+        features = self._word_cache.get(entry.content)
+        if features is None:
+            lowered = entry.content.lower()
+            features = (frozenset(_WORD4.findall(lowered)),
+                        *_signal_bits(lowered))
+            self._word_cache[entry.content] = features
+        return features
 
     def _check_conflict(self, new_entry: MemoryEntry,
                         agent_id: str) -> Optional[Dict]:
         """Check if new memory conflicts with existing ones from other agents."""
-        import re
-        new_words = set(re.findall(r"\w{4,}", new_entry.content.lower()))
+        new_words, new_neg, new_pos = self._index(new_entry)
+        if len(new_words) < 3:
+            return None  # can never reach the 3-word overlap
 
         for existing in self.memories:
+            existing_words, exist_neg, exist_pos = self._index(existing)
+            # Cheapest tests first: word count, then the signal bitmasks
+            # (negation on one side, matching affirmation on the other),
+            # and only then the set intersection.
+            if len(existing_words) < 3:
+                continue
+            if not ((new_neg & exist_pos) or (new_pos & exist_neg)):
+                continue
+
             existing_agent = self._get_agent(existing)
             if existing_agent == agent_id:
                 continue  # Same agent, no conflict
 
-            existing_words = set(
-                re.findall(r"\w{4,}", existing.content.lower()))
-            overlap = len(new_words & existing_words)
-
-            if overlap < 3:
-                continue
-
-            # Check for negation patterns suggesting contradiction
-            new_lower = new_entry.content.lower()
-            exist_lower = existing.content.lower()
-            negation_signals = [
-                ("not ", ""), ("don't ", "do "), ("won't ", "will "),
-                ("can't ", "can "), ("shouldn't ", "should "),
-                ("reject", "accept"), ("disagree", "agree"),
-                ("false", "true"), ("wrong", "right"),
-                ("failed", "succeeded"), ("no ", "yes "),
-            ]
-
-            for neg, pos in negation_signals:
-                if ((neg in new_lower and pos in exist_lower) or
-                        (pos in new_lower and neg in exist_lower)):
-                    return {
-                        "type": "contradiction",
-                        "new_memory": new_entry.hash,
-                        "new_agent": agent_id,
-                        "new_content": new_entry.content[:200],
-                        "existing_memory": existing.hash,
-                        "existing_agent": existing_agent,
-                        "existing_content": existing.content[:200],
-                        "overlap_words": list(new_words & existing_words)[:10],
-                        "detected_at": datetime.now().isoformat(),
-                        "resolved": False,
-                    }
+            if len(new_words & existing_words) >= 3:
+                return {
+                    "type": "contradiction",
+                    "new_memory": new_entry.hash,
+                    "new_agent": agent_id,
+                    "new_content": new_entry.content[:200],
+                    "existing_memory": existing.hash,
+                    "existing_agent": existing_agent,
+                    "existing_content": existing.content[:200],
+                    "overlap_words": list(new_words & existing_words)[:10],
+                    "detected_at": datetime.now().isoformat(),
+                    "resolved": False,
+                }
         return None
 
     def _audit(self, action: str, agent_id: str, detail: str = "") -> None:
-        """Append to audit log (Bug 3 fix: uses atomic write with FileLock)."""
+        """Append one record to the JSONL audit log (O(1) — no full-read/rewrite).
+
+        Replaces the previous JSON-array log, which was re-read and rewritten
+        in full on every action.
+        """
         entry = {
             "timestamp": datetime.now().isoformat(),
             "action": action,
             "agent_id": agent_id,
             "detail": detail,
         }
-        log = []
-        if os.path.exists(self.audit_path):
+        self._audit_ring.append(entry)
+        append_jsonl(self.audit_path, entry, fsync=False)
+        self._audit_lines += 1
+        if self._audit_lines > self.AUDIT_ROTATE_AT:
+            self._rotate_audit()
+
+    def _rotate_audit(self) -> None:
+        """Trim the audit file to the last ``AUDIT_KEEP`` records."""
+        payload = "".join(json.dumps(e) + "\n" for e in self._audit_ring)
+        atomic_write_json(self.audit_path, payload.encode("utf-8"))
+        self._audit_lines = len(self._audit_ring)
+
+    def _load_audit_tail(self) -> None:
+        """Seed the in-memory audit ring from the end of the audit file."""
+        if not os.path.exists(self.audit_path):
+            return
+        try:
+            with open(self.audit_path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except IOError:
+            return
+        self._audit_lines = len(lines)
+        for line in lines[-self.AUDIT_KEEP:]:
             try:
-                with open(self.audit_path) as f:
-                    log = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                log = []
-        log.append(entry)
-        # Keep last 500 entries
-        atomic_write_json(self.audit_path, log[-500:])
+                self._audit_ring.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # torn final line from a crash
@@ -9,17 +9,57 @@ During quiet periods, this engine:
 """
 
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
 from .entry import MemoryEntry
 
+# Significant words for relatedness: 4+ word characters
+_WORD_RE = re.compile(r'\w{4,}')
+
+
+def _scan_content(content: str, regexes: Tuple) -> Tuple:
+    """Gap signals for one memory: (question, todo, refs, terms, explains).
+
+    Module-level (and given the compiled patterns explicitly) so it can run
+    in a worker process.
+    """
+    question_re, todo_re, reference_re, tech_re, explains_re = regexes
+    lowered = content.lower()
+    # One capture group per reference alternative; exactly one participates
+    refs = [m.group(m.lastindex) for m in reference_re.finditer(lowered)]
+    terms = [t.lower() for t in tech_re.findall(content) if len(t) > 2]
+    # Whole words only, so the "is" in "this" or "analysis" doesn't count
+    explains = bool(terms) and explains_re.search(lowered) is not None
+    return (
+        question_re.search(lowered) is not None,
+        todo_re.search(lowered) is not None,
+        refs,
+        terms,
+        explains,
+    )
+
 
 class KnowledgeSynthesizer:
-    """Autonomous knowledge synthesis and gap analysis engine."""
+    """Autonomous knowledge synthesis and gap analysis engine.
+
+    Args:
+        workers: Worker processes for ``identify_gaps`` on corpora of at
+            least ``PARALLEL_MIN_MEMORIES`` memories. Off by default (None
+            or 1: serial scan); starting processes implicitly is unsafe
+            for callers that run threads or lack a ``__main__`` guard.
+    """
+
+    # With workers > 1, identify_gaps fans out to a process pool from this
+    # many memories; below it, process start-up and pickling cost more
+    # than the scan.
+    PARALLEL_MIN_MEMORIES = 5000
 
-    def __init__(self):
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers
         # Question patterns that indicate knowledge gaps
         self._question_patterns = [
             r'what.*(?:is|are|does|would|should|could)',
@@ -45,6 +85,43 @@ class KnowledgeSynthesizer:
             r'(?:as\s+(?:per|in)|according\s+to)\s+(\w+(?:\s+\w+){0,2})',
         ]
 
+        # One precompiled alternation per category: a single scan per memory
+        # instead of one re.findall/re.search per pattern.
+        self._question_re = self._union(self._question_patterns)
+        self._todo_re = self._union(self._todo_patterns)
+        self._reference_re = self._union(self._reference_patterns)
+
+        # Technical terms (acronyms, CamelCase) and definition keywords
+        self._tech_re = re.compile(r'\b(?:[A-Z]{2,}|[A-Z][a-z]+(?:[A-Z][a-z]*)*)\b')
+        self._explains_re = re.compile(r'\b(?:is|means|refers|defined)\b')
+
+    @staticmethod
+    def _union(patterns: List[str]) -> "re.Pattern":
+        # Case-sensitive on purpose: these only ever run over content.lower()
+        # and the patterns are lowercase, and IGNORECASE roughly doubles the
+        # cost of every character the scan has to try.
+        return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+    def _scan_all(self, contents: List[str]) -> List[Tuple]:
+        """Run _scan_content over every memory, in order.
+
+        With ``workers`` > 1, large corpora are split across a process
+        pool (the scan is pure CPU-bound regex work, so threads would
+        serialize on the GIL). Falls back to a serial scan if worker
+        processes are unavailable.
+        """
+        scan = partial(_scan_content, regexes=(
+            self._question_re, self._todo_re, self._reference_re,
+            self._tech_re, self._explains_re,
+        ))
+        if (self.workers or 1) > 1 and len(contents) >= self.PARALLEL_MIN_MEMORIES:
+            try:
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    return list(pool.map(scan, contents, chunksize=256))
+            except (OSError, RuntimeError, NotImplementedError):
+                pass  # e.g. no multiprocessing support in this environment
+        return [scan(content) for content in contents]
+
     def identify_gaps(self, memories: List[MemoryEntry]) -> List[str]:
         """Analyze memories to find topics mentioned but not well-covered.
         
@@ -57,39 +134,28 @@ class KnowledgeSynthesizer:
         gaps = []
         
         # Track mentioned terms and their coverage
-        term_mentions = defaultdict(int)
-        term_explanations = defaultdict(int)
+        term_mentions = Counter()
+        term_explanations = Counter()
         questions = []
         todos = []
         references = set()
         
-        for memory in memories:
-            content = memory.content.lower()
-            
-            # Find explicit questions
-            for pattern in self._question_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
-                    questions.append(memory.content.strip())
+        contents = [memory.content for memory in memories]
+        for content, (is_question, is_todo, refs, terms, explains) in zip(
+                contents, self._scan_all(contents)):
+            # Explicit questions and TODO / incomplete items
+            if is_question:
+                questions.append(content.strip())
+            if is_todo:
+                todos.append(content.strip())
             
-            # Find TODOs and incomplete items
-            for pattern in self._todo_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    todos.append(memory.content.strip())
+            # References to external concepts
+            references.update(refs)
             
-            # Find references to external concepts
-            for pattern in self._reference_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                references.update(matches)
-            
-            # Track technical terms and concepts
-            technical_terms = re.findall(r'\b(?:[A-Z]{2,}|[A-Z][a-z]+(?:[A-Z][a-z]*)*)\b', memory.content)
-            for term in technical_terms:
-                if len(term) > 2:
-                    term_mentions[term.lower()] += 1
-                    # Check if this memory explains the term
-                    if any(word in content for word in ['is', 'means', 'refers', 'defined']):
-                        term_explanations[term.lower()] += 1
+            # Technical terms, and whether this memory explains them
+            term_mentions.update(terms)
+            if explains:
+                term_explanations.update(terms)
         
         # Identify terms mentioned but not explained
         unexplained = []
@@ -129,10 +195,12 @@ class KnowledgeSynthesizer:
         
         # Split new info into chunks
         info_chunks = [chunk.strip() for chunk in new_info.split('\n') if len(chunk.strip()) > 20]
+        # Tokenize the memories once for all chunks
+        word_index = self._word_index(memories) if info_chunks else {}
         
         for i, chunk in enumerate(info_chunks):
             # Find related memories
-            related_memories = self._find_related(chunk, memories)
+            related_memories = self._find_related(chunk, memories, word_index)
             
             if related_memories:
                 # Create synthesis entry
@@ -169,18 +237,21 @@ class KnowledgeSynthesizer:
         
         return synthesized
 
-    def suggest_research_topics(self, memories: List[MemoryEntry], limit: int = 5) -> List[Dict]:
+    def suggest_research_topics(self, memories: List[MemoryEntry], limit: int = 5,
+                                gaps: Optional[List[str]] = None) -> List[Dict]:
         """Suggest research topics based on memory analysis.
         
         Args:
             memories: Memory entries to analyze
             limit: Maximum number of suggestions to return
+            gaps: ``identify_gaps(memories)``, if the caller already has it
             
         Returns:
             List of research suggestions with topic, reason, and priority
         """
         suggestions = []
-        gaps = self.identify_gaps(memories)
+        if gaps is None:
+            gaps = self.identify_gaps(memories)
         
         # Convert gaps to research topics
         for gap in gaps:
@@ -245,7 +316,7 @@ class KnowledgeSynthesizer:
         report["gaps_identified"] = gaps
         
         # Generate research suggestions
-        suggestions = self.suggest_research_topics(memories)
+        suggestions = self.suggest_research_topics(memories, gaps=gaps)
         report["research_suggestions"] = suggestions
         
         # Process research results if provided
@@ -261,34 +332,44 @@ class KnowledgeSynthesizer:
         
         return report
 
-    def _find_related(self, text: str, memories: List[MemoryEntry]) -> List[MemoryEntry]:
-        """Find memories related to the given text."""
-        text_lower = text.lower()
-        text_words = set(re.findall(r'\w{4,}', text_lower))  # Words 4+ chars
-        
-        related = []
-        for memory in memories:
-            memory_words = set(re.findall(r'\w{4,}', memory.content.lower()))
-            overlap = len(text_words & memory_words)
-            if overlap >= 2:  # At least 2 shared significant words
-                related.append((memory, overlap))
+    @staticmethod
+    def _word_index(memories: List[MemoryEntry]) -> Dict[str, List[int]]:
+        """Map each significant word to the positions of the memories using it."""
+        index = defaultdict(list)
+        for position, memory in enumerate(memories):
+            for word in set(_WORD_RE.findall(memory.content.lower())):
+                index[word].append(position)
+        return index
+
+    def _find_related(self, text: str, memories: List[MemoryEntry],
+                      word_index: Optional[Dict[str, List[int]]] = None) -> List[MemoryEntry]:
+        """Find memories related to the given text.
+
+        Overlaps are counted through ``word_index`` (see ``_word_index``),
+        so only memories sharing a word with ``text`` are visited.
+        """
+        if word_index is None:
+            word_index = self._word_index(memories)
+        overlaps = Counter()
+        for word in set(_WORD_RE.findall(text.lower())):
+            overlaps.update(word_index.get(word, ()))
         
-        # Sort by overlap and return top matches
-        related.sort(key=lambda x: x[1], reverse=True)
-        return [mem for mem, _ in related[:5]]
+        # At least 2 shared significant words; most overlap first, ties in
+        # memory order
+        related = sorted((p for p, n in overlaps.items() if n >= 2),
+                         key=lambda p: (-overlaps[p], p))
+        return [memories[p] for p in related[:5]]
 
     def _cluster_topics(self, memories: List[MemoryEntry]) -> Dict[str, int]:
         """Identify topic clusters in memories."""
-        topic_counts = defaultdict(int)
+        topic_counts = Counter()
         
         for memory in memories:
             # Extract potential topics (capitalized terms, technical terms)
             topics = re.findall(r'\b[A-Z][a-z]+(?:[A-Z][a-z]*)*\b', memory.content)
             topics.extend(memory.tags)
             
-            for topic in topics:
-                if len(topic) > 3:
-                    topic_counts[topic.lower()] += 1
+            topic_counts.update(topic.lower() for topic in topics if len(topic) > 3)
         
         # Filter to meaningful clusters (3+ mentions)
         return {topic: count for topic, count in topic_counts.items() if count >= 3}
\ No newline at end of file
@@ -2,11 +2,30 @@
 
 import re
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Optional
 from .entry import MemoryEntry
 
 DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
 
+_by_created = attrgetter("created")
+
+
+def _bisect_date(memories: List[MemoryEntry], date: str, right: bool) -> int:
+    """Binary search a created-sorted list on the ``created[:10]`` day key.
+
+    Hand-rolled because ``bisect`` only takes ``key=`` from Python 3.10.
+    """
+    lo, hi = 0, len(memories)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        day = memories[mid].created[:10]
+        if day < date or (right and day == date):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
 
 class TemporalEngine:
     """Time-aware memory queries and narrative construction."""
@@ -19,18 +38,27 @@ class TemporalEngine:
     @staticmethod
     def on_date(memories: List[MemoryEntry], date: str) -> List[MemoryEntry]:
         """Return memories associated with a specific date."""
-        results = []
-        for m in memories:
-            if date in m.source or date in m.content or m.created.startswith(date):
-                results.append(m)
-        return results
+        # Cheapest and most common match first: the short created prefix
+        # settles most hits before the content is scanned.
+        return [m for m in memories
+                if m.created.startswith(date) or date in m.content or date in m.source]
 
     @staticmethod
-    def between(memories: List[MemoryEntry], start: str, end: str) -> List[MemoryEntry]:
-        """Return memories created between two dates (inclusive)."""
+    def between(memories: List[MemoryEntry], start: str, end: str,
+                presorted: bool = False) -> List[MemoryEntry]:
+        """Return memories created between two dates (inclusive).
+
+        Pass ``presorted=True`` when ``memories`` is already ordered by
+        ``created`` (e.g. append-only ingestion) to locate the range by
+        binary search in O(log N + K) instead of scanning and sorting.
+        """
+        if presorted:
+            lo = _bisect_date(memories, start, right=False)
+            hi = _bisect_date(memories, end, right=True)
+            return memories[lo:hi]
         return sorted(
             [m for m in memories if start <= m.created[:10] <= end],
-            key=lambda x: x.created,
+            key=_by_created,
         )
 
     @staticmethod
@@ -41,7 +69,7 @@ class TemporalEngine:
             t = topic.lower()
             relevant = [m for m in memories if t in m.content.lower()]
 
-        relevant = sorted(relevant, key=lambda x: x.created)
+        relevant = sorted(relevant, key=_by_created)
         if not relevant:
             return f"No memories found{' about ' + topic if topic else ''}."
 
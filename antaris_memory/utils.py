@@ -12,56 +12,280 @@ def cosine_similarity(vec_a: list, vec_b: list) -> float:
         return 0.0
     return dot / (mag_a * mag_b)
 
+import atexit
+import hashlib
 import json
 import os
 import tempfile
+import threading
 import logging
+from contextlib import contextmanager
+
+try:  # optional accelerator: pip install orjson
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger("antaris_memory")
 
+# abspath -> (payload digest, st_ino, st_mtime_ns, st_size) of our last
+# write, so an identical re-save of an untouched file can skip the temp
+# file + fsync + rename. Atomic writers replace the inode, so st_ino catches
+# other processes' writes even within coarse mtime granularity.
+_LAST_WRITES: dict = {}
+
+# Directories atomic_write_json has already created, so repeated saves
+# skip the makedirs() stat calls. A directory removed later is recreated
+# when mkstemp reports it missing.
+_KNOWN_DIRS: set = set()
+
+# Per-thread group-commit state for batch_writes()
+_batch = threading.local()
+
+
+@contextmanager
+def batch_writes():
+    """Group-commit ``atomic_write_json`` calls made inside the block.
+
+    Each write still goes to its own temp file, but the fsyncs and the
+    ``os.replace`` are deferred to block exit, where all temp files are
+    fsynced, renamed into place, and each parent directory is fsynced
+    once. N saves then cost one commit instead of N.
+
+    Trade-off: until the block exits, writes are not visible at their
+    paths and a crash loses them (the previous files stay intact, so
+    nothing is ever torn). Pending writes are still committed if the
+    block raises. Nested blocks commit with the outermost one.
+    ``remove_file`` deletions requested inside the block run after the
+    renames.
+    """
+    depth = getattr(_batch, "depth", 0)
+    if depth == 0:
+        _batch.pending = {}  # path -> (tmp_path, dir_path, digest, durable)
+        _batch.removals = set()
+    _batch.depth = depth + 1
+    try:
+        yield
+    finally:
+        _batch.depth = depth
+        if depth == 0:
+            pending, _batch.pending = _batch.pending, None
+            removals, _batch.removals = _batch.removals, None
+            _commit_batch(pending, removals)
+
+
+def remove_file(path: str) -> None:
+    """Delete ``path`` if it exists.
+
+    Inside ``batch_writes()`` the deletion is deferred to block exit,
+    after the batch's writes are renamed into place, so a file replaced by
+    one in another format is never missing both copies. A write that
+    was still pending to ``path`` is dropped.
+    """
+    pending = getattr(_batch, "pending", None)
+    if pending is not None:
+        staged = pending.pop(path, None)
+        if staged is not None:
+            os.unlink(staged[0])
+        _batch.removals.add(path)
+        return
+    _remove_if_exists(path)
+
+
+def _remove_if_exists(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    _LAST_WRITES.pop(os.path.abspath(path), None)
+
+
+def _commit_batch(pending: dict, removals: set = ()) -> None:
+    """fsync, rename and dir-fsync the temp files staged by a batch,
+    then perform its deferred removals."""
+    for tmp_path, _, _, durable in pending.values():
+        if durable:
+            fd = os.open(tmp_path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+    dirs = set()
+    for path, (tmp_path, dir_path, digest, durable) in pending.items():
+        os.replace(tmp_path, path)
+        st = os.stat(path)
+        _LAST_WRITES[os.path.abspath(path)] = (digest, st.st_ino, st.st_mtime_ns, st.st_size)
+        if durable:
+            dirs.add(dir_path)
+    for dir_path in dirs:
+        _fsync_dir(dir_path)
+    for path in removals:
+        _remove_if_exists(path)
+
+
+def dump_json_bytes(data, indent: int = 2) -> bytes:
+    """Serialize ``data`` to UTF-8 JSON bytes, using orjson when available.
+
+    orjson only supports 2-space indentation, so other ``indent`` values
+    (and payloads orjson rejects, e.g. non-string keys) use the stdlib.
+    """
+    if orjson is not None and indent in (None, 2):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    if indent is None:
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return json.dumps(data, indent=indent).encode("utf-8")
+
+
+def load_json_bytes(raw: bytes):
+    """Parse JSON from bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def append_jsonl(path: str, record, fsync: bool = True) -> None:
+    """Append ``record`` to a JSON-lines file with one ``O_APPEND`` write.
+
+    The kernel positions each ``O_APPEND`` write at end-of-file, so
+    concurrent appenders on a local filesystem never interleave inside a
+    line, and a crash leaves at most a truncated last line (which JSONL
+    readers skip). Cost is O(record), independent of the file size.
+
+    Args:
+        path: JSONL file; created if missing.
+        record: JSON-serializable object, written compactly on one line.
+        fsync: Flush the record to stable storage before returning. Logs
+            that only need to survive a process crash can pass False.
+    """
+    extend_jsonl(path, (record,), fsync=fsync)
+
 
-def atomic_write_json(path: str, data: dict, indent: int = 2, lock: bool = True) -> None:
+def extend_jsonl(path: str, records, fsync: bool = True) -> None:
+    """``append_jsonl`` for several records, written with one ``write()``."""
+    payload = b"".join(dump_json_bytes(r, indent=None) + b"\n" for r in records)
+    if not payload:
+        return
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        _write_all(fd, payload)
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_json(path: str, data, indent: int = 2, lock: bool = False,
+                      compact: bool = False, durable: bool = True) -> None:
     """Write JSON atomically with optional file locking.
     
-    Prevents torn/partial writes from crashes or interrupted I/O.
-    When lock=True (default), also prevents lost updates from concurrent writers
-    using a directory-based lock.
+    Prevents torn/partial writes from crashes or interrupted I/O: the
+    payload goes to a temp file that is fsynced and then ``os.replace``d
+    over ``path``, so readers see either the old or the new file, never a
+    mix. That needs no lock, so writing a full in-memory snapshot (the
+    ``save()`` pattern) is lock-free by default.
+
+    A lock held only around the write cannot prevent lost updates from a
+    read-modify-write cycle. Callers doing RMW should use
+    ``VersionTracker.safe_update`` (optimistic) or hold a ``FileLock``
+    across the whole cycle; ``lock=True`` additionally serializes this
+    write with other ``FileLock`` holders.
     
     Args:
         path: File path to write
-        data: JSON-serializable data
+        data: JSON-serializable data, or already-encoded JSON ``bytes``
+            (see ``dump_json_bytes``) which are written verbatim
         indent: JSON indentation
-        lock: If True, acquire a file lock before writing (default: True)
+        lock: If True, acquire a file lock before writing (default: False)
+        compact: If True, ignore ``indent`` and write minimal JSON (no
+            whitespace). Lets the C encoder handle the whole document —
+            several times faster and ~30% smaller for machine-read files.
+        durable: If False, skip the file and directory fsyncs. The write is
+            still atomic (never torn), but a power loss may roll it back or
+            lose it. For derived or rebuildable state such as caches.
     """
     dir_path = os.path.dirname(path) or "."
-    os.makedirs(dir_path, exist_ok=True)
+    if dir_path not in _KNOWN_DIRS:
+        os.makedirs(dir_path, exist_ok=True)
+        _KNOWN_DIRS.add(dir_path)
+
+    if not isinstance(data, bytes):
+        # Encode up front (outside the lock) and write once: json.dump()
+        # streams through the pure-Python iterencode path, one write() per
+        # token. Output stays ASCII-escaped, like json.dump.
+        if compact:
+            data = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        else:
+            data = json.dumps(data, indent=indent).encode("utf-8")
     
     if lock:
         from .locking import FileLock
         with FileLock(path, timeout=30.0):
-            _do_atomic_write(path, data, indent, dir_path)
+            _do_atomic_write(path, data, indent, dir_path, durable)
     else:
-        _do_atomic_write(path, data, indent, dir_path)
+        _do_atomic_write(path, data, indent, dir_path, durable)
 
 
-def _do_atomic_write(path: str, data, indent: int, dir_path: str) -> None:
-    """Internal: perform the actual atomic write."""
-    fd, tmp_path = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
+def _do_atomic_write(path: str, data: bytes, indent: int, dir_path: str,
+                     durable: bool = True) -> None:
+    """Internal: perform the actual atomic write of encoded JSON bytes.
+
+    Skipped when ``data`` matches what this process last wrote to ``path``
+    and the file's inode/mtime/size show nobody has touched it since, or,
+    inside ``batch_writes()``, when it matches the write already pending
+    for ``path``.
+    """
+    key = os.path.abspath(path)
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    pending = getattr(_batch, "pending", None)
+    staged = pending.get(path) if pending is not None else None
+    if staged is not None:
+        # The pending write, not the file on disk, is what will land
+        if staged[2] == digest:
+            return
+        last = None
+    else:
+        last = _LAST_WRITES.get(key)
+    if last is not None and last[0] == digest:
+        try:
+            st = os.stat(path)
+        except OSError:
+            pass
+        else:
+            if (st.st_ino, st.st_mtime_ns, st.st_size) == last[1:]:
+                return
+
+    # mkstemp's O_EXCL create is what makes the temp name race-free; the
+    # payload then goes straight to the fd (no buffered file object, the
+    # bytes are already fully encoded).
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
+    except FileNotFoundError:  # directory removed since it was created
+        os.makedirs(dir_path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
     try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(data, f, indent=indent)
-            f.flush()
-            os.fsync(f.fileno())
-        os.replace(tmp_path, path)
-        # Best-effort directory fsync for crash-consistent rename on POSIX
         try:
-            dir_fd = os.open(dir_path, os.O_RDONLY)
-            try:
-                os.fsync(dir_fd)
-            finally:
-                os.close(dir_fd)
-        except (OSError, AttributeError):
-            pass  # Windows or unsupported — rename is still atomic
+            _write_all(fd, data)
+            if pending is None and durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        if pending is not None:
+            # Inside batch_writes(): fsync + rename happen at block exit.
+            # A later write to the same path supersedes this one.
+            previous = pending.pop(path, None)
+            pending[path] = (tmp_path, dir_path, digest, durable)
+            _batch.removals.discard(path)
+            if previous is not None:
+                os.unlink(previous[0])
+            return
+        os.replace(tmp_path, path)
+        st = os.stat(path)
+        _LAST_WRITES[key] = (digest, st.st_ino, st.st_mtime_ns, st.st_size)
+        if durable:
+            _fsync_dir(dir_path)
     except BaseException:
         try:
             os.unlink(tmp_path)
@@ -70,6 +294,90 @@ def _do_atomic_write(path: str, data, indent: int, dir_path: str) -> None:
         raise
 
 
+def _write_all(fd: int, data: bytes) -> None:
+    """``os.write`` until every byte is written (short writes are rare)."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _fsync_dir(dir_path: str) -> None:
+    """Best-effort directory fsync for crash-consistent rename on POSIX."""
+    try:
+        dir_fd = os.open(dir_path, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except (OSError, AttributeError):
+        pass  # Windows or unsupported — rename is still atomic
+
+
+class AsyncFlusher:
+    """Run ``flush_fn`` on a background thread instead of on the caller's path.
+
+    Callers ``mark_dirty()`` after changing state; a daemon thread wakes,
+    waits ``interval`` seconds so bursts of changes coalesce into one
+    flush, then calls ``flush_fn``. Code that mutates the state being
+    flushed should hold ``flusher.lock`` so a flush never sees it half
+    updated. ``close()`` (also run at interpreter exit) stops the thread
+    and performs a final flush.
+    """
+
+    def __init__(self, flush_fn, interval: float = 5.0):
+        self.flush_fn = flush_fn
+        self.interval = interval
+        self.lock = threading.RLock()
+        self._dirty = False
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="antaris-memory-flusher", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+        self._wake.set()
+
+    def flush(self) -> None:
+        """Flush now, on the calling thread, if anything is pending."""
+        with self.lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            try:
+                self.flush_fn()
+            except BaseException:
+                self._dirty = True
+                raise
+
+    def close(self) -> None:
+        """Stop the background thread and flush anything still pending."""
+        if not self._stop.is_set():
+            self._stop.set()
+            self._wake.set()
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            atexit.unregister(self.close)
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            if self._stop.wait(self.interval):
+                return  # close() does the final flush
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Background flush failed: {e}")
+
+
 def locked_read_json(path: str, default=None):
     """Read a JSON file with a shared lock to prevent torn reads.
     
@@ -85,5 +393,7 @@ def locked_read_json(path: str, default=None):
     
     from .locking import FileLock
     with FileLock(path, timeout=10.0):
-        with open(path) as f:
-            return json.load(f)
+        # One read of the raw bytes, parsed by orjson when available
+        with open(path, "rb") as f:
+            raw = f.read()
+    return load_json_bytes(raw)
@@ -27,46 +27,131 @@ Usage:
 
 import hashlib
 import json
+import mmap
 import os
+import random
 import time
 import logging
-from typing import Callable, Optional, Any
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger("antaris_memory")
 
+_HASH_CHUNK = 64 * 1024
+
+# Snapshots of files up to this size keep their bytes, so check() can
+# compare directly instead of re-hashing the whole file.
+_CONTENT_CAP = 4 * 1024 * 1024
+
+# os.scandir() only returns full stat results without extra syscalls on
+# Windows; on POSIX DirEntry.stat() is one stat() call per file anyway.
+_SCANDIR_STAT = os.name == "nt"
+
+
+def _bytes_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _same_content(path: str, expected: bytes) -> bool:
+    """Compare a file against ``expected`` through mmap, chunk by chunk.
+
+    Stops at the first differing chunk and never copies more than one
+    chunk of the file; several times faster than hashing it.
+    """
+    if not expected:
+        return os.path.getsize(path) == 0
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return False
+        with mm:
+            if len(mm) != len(expected):
+                return False
+            for i in range(0, len(expected), _HASH_CHUNK):
+                if mm[i:i + _HASH_CHUNK] != expected[i:i + _HASH_CHUNK]:
+                    return False
+    return True
+
+
+def _content_hash(path: str) -> str:
+    """BLAKE2b-128 of a file's bytes, streamed in 64 KiB chunks.
+
+    Used only to detect concurrent modification (not adversarial), so
+    BLAKE2b (faster than SHA-256) is enough; the file is never held in
+    memory at once.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
 
 class ConflictError(Exception):
     """Raised when a file has been modified since it was read."""
     
-    def __init__(self, path: str, expected_mtime: float, actual_mtime: float):
+    def __init__(self, path: str, expected_mtime: float, actual_mtime: float,
+                 expected_mtime_ns: Optional[int] = None,
+                 actual_mtime_ns: Optional[int] = None):
         self.path = path
         self.expected_mtime = expected_mtime
         self.actual_mtime = actual_mtime
+        self.expected_mtime_ns = expected_mtime_ns
+        self.actual_mtime_ns = actual_mtime_ns
+        self.conflicts = [self]  # check_many() lists every conflict here
+        if expected_mtime_ns is not None and actual_mtime_ns is not None:
+            detail = f"expected mtime_ns={expected_mtime_ns}, actual={actual_mtime_ns}"
+        else:
+            detail = f"expected mtime={expected_mtime:.6f}, actual={actual_mtime:.6f}"
         super().__init__(
             f"Conflict detected on {os.path.basename(path)}: "
-            f"file modified since last read "
-            f"(expected mtime={expected_mtime:.6f}, actual={actual_mtime:.6f})"
+            f"file modified since last read ({detail})"
         )
 
+    @classmethod
+    def _from_ns(cls, path: str, expected_ns: int, actual_ns: int) -> "ConflictError":
+        return cls(path, expected_ns / 1e9, actual_ns / 1e9, expected_ns, actual_ns)
+
 
 class FileVersion:
-    """Snapshot of a file's state at a point in time."""
+    """Snapshot of a file's state at a point in time.
+
+    The modification time is kept as integer nanoseconds (``st_mtime_ns``):
+    a float ``st_mtime`` cannot represent current timestamps to the
+    nanosecond, so two writes close together could compare equal.
+    """
     
-    __slots__ = ("path", "mtime", "size", "content_hash", "taken_at")
+    __slots__ = ("path", "mtime_ns", "size", "_content_hash", "taken_at",
+                 "content_bytes")
     
-    def __init__(self, path: str, mtime: float, size: int, 
-                 content_hash: str, taken_at: float):
+    def __init__(self, path: str, mtime_ns: int, size: int, 
+                 content_hash: str, taken_at: float,
+                 content_bytes: Optional[bytes] = None):
         self.path = path
-        self.mtime = mtime
+        self.mtime_ns = mtime_ns
         self.size = size
-        self.content_hash = content_hash
+        self._content_hash = content_hash
         self.taken_at = taken_at
+        self.content_bytes = content_bytes
+
+    @property
+    def content_hash(self) -> str:
+        """BLAKE2b-128 hex digest; computed on demand when only bytes are kept."""
+        if not self._content_hash and self.content_bytes is not None:
+            self._content_hash = _bytes_hash(self.content_bytes)
+        return self._content_hash
+
+    @property
+    def mtime(self) -> float:
+        """Modification time in seconds (display only; compare ``mtime_ns``)."""
+        return self.mtime_ns / 1e9
     
     def is_current(self) -> bool:
         """Check if the file still matches this snapshot."""
         try:
             stat = os.stat(self.path)
-            if stat.st_mtime != self.mtime:
+            if stat.st_mtime_ns != self.mtime_ns:
                 return False
             if stat.st_size != self.size:
                 return False
@@ -85,9 +170,11 @@ class VersionTracker:
     def __init__(self, use_content_hash: bool = False):
         """
         Args:
-            use_content_hash: If True, also compute SHA-256 of file content
-                for stronger conflict detection. Slower but catches
-                same-mtime-different-content edge cases.
+            use_content_hash: If True, also compare file content for
+                stronger conflict detection. Slower but catches
+                same-mtime-different-content edge cases. Files up to 4 MiB
+                are compared byte-for-byte against the snapshot (kept in
+                memory); larger ones by BLAKE2b digest.
         """
         self.use_content_hash = use_content_hash
     
@@ -98,21 +185,26 @@ class VersionTracker:
             path: Path to the file
             
         Returns:
-            FileVersion capturing the file's mtime, size, and optionally content hash.
+            FileVersion capturing the file's mtime_ns, size, and optionally content hash.
         """
         stat = os.stat(path)
         
         content_hash = ""
+        content_bytes = None
         if self.use_content_hash:
-            with open(path, "rb") as f:
-                content_hash = hashlib.sha256(f.read()).hexdigest()
+            if stat.st_size <= _CONTENT_CAP:
+                with open(path, "rb") as f:
+                    content_bytes = f.read()
+            else:
+                content_hash = _content_hash(path)
         
         return FileVersion(
             path=path,
-            mtime=stat.st_mtime,
+            mtime_ns=stat.st_mtime_ns,
             size=stat.st_size,
             content_hash=content_hash,
             taken_at=time.time(),
+            content_bytes=content_bytes,
         )
     
     def check(self, version: FileVersion) -> None:
@@ -128,25 +220,88 @@ class VersionTracker:
         try:
             stat = os.stat(version.path)
         except FileNotFoundError:
-            raise ConflictError(version.path, version.mtime, 0)
+            stat = None
+        self._check_stat(version, stat)
+
+    def check_many(self, versions: List[FileVersion]) -> None:
+        """Verify several snapshots in one pass.
+
+        Unlike calling check() in a loop, every version is examined. On
+        Windows each directory is listed once with ``os.scandir`` instead
+        of stat-ing every file.
+
+        Raises:
+            ConflictError: For the first conflicting file; its
+                ``conflicts`` attribute holds one error per conflicting file.
+        """
+        stats = self._stat_many([v.path for v in versions])
+        errors = []
+        for version in versions:
+            try:
+                self._check_stat(version, stats.get(version.path))
+            except ConflictError as e:
+                errors.append(e)
+        if errors:
+            first = errors[0]
+            first.conflicts = errors
+            if len(errors) > 1:
+                others = ", ".join(os.path.basename(e.path) for e in errors[1:])
+                first.args = (f"{first.args[0]}; also modified: {others}",)
+            raise first
+
+    @staticmethod
+    def _stat_many(paths: List[str]) -> Dict[str, os.stat_result]:
+        """Stat ``paths``; missing files are left out of the result."""
+        stats = {}
+        if not _SCANDIR_STAT:
+            for path in paths:
+                try:
+                    stats[path] = os.stat(path)
+                except FileNotFoundError:
+                    pass
+            return stats
+        by_dir = defaultdict(dict)
+        for path in paths:
+            by_dir[os.path.dirname(path) or "."][os.path.basename(path)] = path
+        for dir_path, names in by_dir.items():
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        path = names.get(entry.name)
+                        if path is not None:
+                            stats[path] = entry.stat()
+            except FileNotFoundError:
+                pass
+        return stats
+
+    def _check_stat(self, version: FileVersion,
+                    stat: Optional[os.stat_result]) -> None:
+        if stat is None:
+            raise ConflictError._from_ns(version.path, version.mtime_ns, 0)
         
-        if stat.st_mtime != version.mtime or stat.st_size != version.size:
-            raise ConflictError(version.path, version.mtime, stat.st_mtime)
+        if stat.st_mtime_ns != version.mtime_ns or stat.st_size != version.size:
+            raise ConflictError._from_ns(version.path, version.mtime_ns, stat.st_mtime_ns)
         
-        if self.use_content_hash and version.content_hash:
-            with open(version.path, "rb") as f:
-                current_hash = hashlib.sha256(f.read()).hexdigest()
-            if current_hash != version.content_hash:
-                raise ConflictError(version.path, version.mtime, stat.st_mtime)
+        if self.use_content_hash:
+            if version.content_bytes is not None:
+                same = _same_content(version.path, version.content_bytes)
+            elif version.content_hash:
+                same = _content_hash(version.path) == version.content_hash
+            else:
+                same = True
+            if not same:
+                raise ConflictError._from_ns(version.path, version.mtime_ns, stat.st_mtime_ns)
     
     def safe_update(self, path: str, modifier: Callable[[Any], Any],
-                    max_retries: int = 3) -> Any:
+                    max_retries: int = 5) -> Any:
         """Read-modify-write with automatic retry on conflict.
         
         Args:
             path: Path to JSON file
             modifier: Function that takes parsed JSON data and returns modified data
-            max_retries: Number of retry attempts on conflict
+            max_retries: Number of retry attempts on conflict. Retries back
+                off exponentially (5 ms doubling, capped at 0.5 s) with
+                ±50% jitter so contending writers don't retry in lockstep.
             
         Returns:
             The modified data that was written
@@ -157,10 +312,24 @@ class VersionTracker:
         from .utils import atomic_write_json
         
         for attempt in range(max_retries + 1):
-            version = self.snapshot(path)
-            
-            with open(path) as f:
-                data = json.load(f)
+            # One open: fstat the handle we read from, so the version
+            # describes exactly the bytes parsed (no stat/open race) and
+            # the content check needs no second read.
+            with open(path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                raw = f.read()
+            # raw is held for the whole attempt anyway, so content checks
+            # compare against it whatever its size: nothing is hashed, and
+            # check() only reads the file when mtime and size still match.
+            version = FileVersion(
+                path=path,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                content_hash="",
+                taken_at=time.time(),
+                content_bytes=raw if self.use_content_hash else None,
+            )
+            data = json.loads(raw)
             
             modified = modifier(data)
             
@@ -172,7 +341,8 @@ class VersionTracker:
                         f"Conflict on {os.path.basename(path)}, "
                         f"retry {attempt + 1}/{max_retries}"
                     )
-                    time.sleep(0.01 * (attempt + 1))  # Brief backoff
+                    time.sleep(min(0.5, 0.005 * (2 ** attempt))
+                               * random.uniform(0.5, 1.5))
                     continue
                 raise
             
@@ -31,6 +31,7 @@ except ImportError:
             self.content = content
 
 from antaris_memory import MemorySystem
+from antaris_memory.utils import AsyncFlusher
 
 
 class AntarisLangChainMemory(BaseMemory):
@@ -45,12 +46,16 @@ class AntarisLangChainMemory(BaseMemory):
         return_messages: bool = False,
         max_token_limit: Optional[int] = None,
         decay_half_life: float = 7.0,
-        use_gating: bool = True
+        use_gating: bool = True,
+        flush_interval: float = 5.0
     ):
         self.workspace = workspace
         self.memory_key = memory_key
         self.human_prefix = human_prefix
         self.ai_prefix = ai_prefix
+        # Fixed parts of the stored "[timestamp] Speaker: text" lines
+        self._human_tag = f"] {human_prefix}: "
+        self._ai_tag = f"] {ai_prefix}: "
         self.return_messages = return_messages
         self.max_token_limit = max_token_limit
         self.use_gating = use_gating
@@ -65,6 +70,10 @@ class AntarisLangChainMemory(BaseMemory):
         # Load existing memories
         self.memory_system.load()
         
+        # Save in the background, at most every flush_interval seconds,
+        # so disk I/O stays off the chain's request path
+        self._flusher = AsyncFlusher(self.memory_system.save, flush_interval)
+        
         # Track conversation context
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         
@@ -88,42 +97,43 @@ class AntarisLangChainMemory(BaseMemory):
             
             if self.return_messages:
                 # Return as message objects
+                human_speakers = {self.human_prefix.lower(), "human", "user"}
                 messages = []
                 for mem in relevant_memories:
                     # Parse stored conversation format
-                    if ":" in mem.content and "[" in mem.content:
-                        # Extract speaker and content from stored format
-                        # Format: "[timestamp] Speaker: content"
-                        try:
-                            parts = mem.content.split("] ", 1)[1]  # Remove timestamp
-                            speaker, content = parts.split(": ", 1)
-                            
-                            if speaker.lower() in [self.human_prefix.lower(), "human", "user"]:
-                                messages.append(HumanMessage(content=content))
-                            else:
-                                messages.append(AIMessage(content=content))
-                        except (ValueError, IndexError):
-                            # Fallback for non-standard format
-                            messages.append(AIMessage(content=mem.content))
+                    content = mem.content
+                    if ":" not in content or "[" not in content:
+                        continue
+                    # Extract speaker and content from stored format
+                    # Format: "[timestamp] Speaker: content"
+                    _, stamped, rest = content.partition("] ")  # Remove timestamp
+                    speaker, spoken, text = rest.partition(": ")
+                    if not (stamped and spoken):
+                        # Fallback for non-standard format
+                        messages.append(AIMessage(content=content))
+                    elif speaker.lower() in human_speakers:
+                        messages.append(HumanMessage(content=text))
+                    else:
+                        messages.append(AIMessage(content=text))
                 
                 memory_value = messages[-20:]  # Limit to recent messages
             else:
-                # Return as formatted string
-                memory_lines = []
-                for mem in relevant_memories[-10:]:  # Most recent relevant
-                    # Clean up the stored format for display
-                    content = mem.content
-                    if "] " in content and ":" in content:
-                        # Remove timestamp, keep speaker format
-                        content = content.split("] ", 1)[1]
-                    memory_lines.append(content)
-                
-                memory_value = "\n".join(memory_lines)
+                # Return as formatted string, most recent relevant last
+                memory_value = "\n".join([
+                    self._strip_timestamp(mem.content)
+                    for mem in relevant_memories[-10:]
+                ])
         else:
             memory_value = [] if self.return_messages else ""
         
         return {self.memory_key: memory_value}
     
+    @staticmethod
+    def _strip_timestamp(content: str) -> str:
+        """Drop the "[timestamp] " prefix, keeping the "Speaker: text" part."""
+        _, stamped, rest = content.partition("] ")
+        return rest if stamped and ":" in content else content
+    
     def save_context(self, inputs: Dict[str, Any], outputs: Dict[str, Any]) -> None:
         """Save the context to memory."""
         # Extract human input
@@ -135,37 +145,41 @@ class AntarisLangChainMemory(BaseMemory):
         timestamp = datetime.now().isoformat()
         
         # Format conversation entries
-        conversation_content = f"[{timestamp}] {self.human_prefix}: {human_input}\n[{timestamp}] {self.ai_prefix}: {ai_output}"
+        conversation_content = "".join((
+            "[", timestamp, self._human_tag, human_input,
+            "\n[", timestamp, self._ai_tag, ai_output,
+        ))
         
         source = f"langchain_session:{self.session_id}"
         
-        if self.use_gating:
-            # Use intelligent gating for automatic categorization
-            context = {
-                "source": "langchain",
-                "session_id": self.session_id,
-                "interaction_type": "conversation"
-            }
-            self.memory_system.ingest_with_gating(conversation_content, source, context)
-        else:
-            # Use standard ingestion
-            self.memory_system.ingest(conversation_content, source, "tactical")
+        with self._flusher.lock:
+            if self.use_gating:
+                # Use intelligent gating for automatic categorization
+                context = {
+                    "source": "langchain",
+                    "session_id": self.session_id,
+                    "interaction_type": "conversation"
+                }
+                self.memory_system.ingest_with_gating(conversation_content, source, context)
+            else:
+                # Use standard ingestion
+                self.memory_system.ingest(conversation_content, source, "tactical")
         
-        # Auto-save periodically
-        if len(self.memory_system.memories) % 10 == 0:
-            self.memory_system.save()
+        # Picked up by the background flusher
+        self._flusher.mark_dirty()
     
     def clear(self) -> None:
         """Clear memory (start fresh session)."""
         # Start a new session rather than clearing all memory
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Optionally save current state before clearing
-        self.memory_system.save()
+        # Flush current state before starting over
+        self._flusher.flush()
     
     def save_memory(self) -> str:
         """Explicitly save memory to disk."""
-        return self.memory_system.save()
+        with self._flusher.lock:
+            return self.memory_system.save()
     
     def search_memory(self, query: str, limit: int = 5) -> List[Dict]:
         """Search memory explicitly."""
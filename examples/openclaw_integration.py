@@ -18,6 +18,7 @@ import json
 
 # Assuming antaris-memory is installed
 from antaris_memory import MemorySystem
+from antaris_memory.utils import atomic_write_json, batch_writes
 
 class OpenClawMemoryManager:
     """Memory manager for OpenClaw agents."""
@@ -110,42 +111,47 @@ class OpenClawMemoryManager:
     
     def heartbeat_memory_cycle(self) -> Dict:
         """Run during OpenClaw heartbeat for autonomous processing."""
-        now = datetime.now()
-        report = {
-            "timestamp": now.isoformat(),
-            "actions": [],
-            "suggestions": []
-        }
+        # Group-commit every file write in the cycle: one fsync pass at the end
+        # instead of one per save.
+        with batch_writes():
+            now = datetime.now()
+            report = {
+                "timestamp": now.isoformat(),
+                "actions": [],
+                "suggestions": []
+            }
         
-        # Run knowledge synthesis every ~6 heartbeats (3 hours if 30min heartbeats)
-        should_synthesize = (
-            not self.last_heartbeat or 
-            (now - datetime.fromisoformat(self.last_heartbeat)).total_seconds() > 10800  # 3 hours
-        )
+            # Run knowledge synthesis every ~6 heartbeats (3 hours if 30min heartbeats)
+            should_synthesize = (
+                not self.last_heartbeat or 
+                (now - datetime.fromisoformat(self.last_heartbeat)).total_seconds() > 10800  # 3 hours
+            )
         
-        if should_synthesize:
-            synthesis_report = self.memory.synthesize()
-            report["synthesis"] = synthesis_report
-            report["actions"].append("knowledge_synthesis")
+            if should_synthesize:
+                synthesis_report = self.memory.synthesize()
+                report["synthesis"] = synthesis_report
+                report["actions"].append("knowledge_synthesis")
             
-            # Generate research suggestions
-            suggestions = self.memory.research_suggestions(limit=3)
-            report["suggestions"].extend(suggestions)
+                # Generate research suggestions
+                suggestions = self.memory.research_suggestions(limit=3)
+                report["suggestions"].extend(suggestions)
             
-            # Update heartbeat state
-            self.last_heartbeat = now.isoformat()
-            with open(self.heartbeat_state_file, "w") as f:
-                json.dump({"last_heartbeat": self.last_heartbeat}, f)
-        
-        # Memory maintenance
-        stats = self.memory.stats()
-        if stats["total"] > 1000:  # If too many memories
-            # Run consolidation to find duplicates and clusters
-            consolidation = self.memory.consolidate()
-            report["consolidation"] = consolidation
-            report["actions"].append("consolidation")
-        
-        return report
+                # Update heartbeat state
+                self.last_heartbeat = now.isoformat()
+                # Losing this on power failure only triggers an early synthesis
+                atomic_write_json(self.heartbeat_state_file,
+                                  {"last_heartbeat": self.last_heartbeat},
+                                  durable=False)
+        
+            # Memory maintenance
+            stats = self.memory.stats()
+            if stats["total"] > 1000:  # If too many memories
+                # Run consolidation to find duplicates and clusters
+                consolidation = self.memory.consolidate()
+                report["consolidation"] = consolidation
+                report["actions"].append("consolidation")
+        
+            return report
     
     def save_memory(self) -> str:
         """Save memory state to disk."""
@@ -103,8 +103,8 @@ def main():
     
     # Demonstrate decay scoring
     print(f"\n⏰ Decay Scores (fresher memories score higher):")
-    for i, mem in enumerate(memory.memories[:5]):  # Show first 5
-        decay_score = memory.decay.score(mem)
+    shown = memory.memories[:5]  # Show first 5
+    for i, (mem, decay_score) in enumerate(zip(shown, memory.decay.score_batch(shown))):
         print(f"  {i+1}. Score: {decay_score:.3f} | {mem.content[:60]}...")
     
     # Demonstrate sentiment analysis
@@ -171,7 +171,8 @@ def main():
     print(f"   ✓ Temporal queries and narrative generation")
     print(f"   ✓ Persistence and selective forgetting")
     print(f"\n   Next steps:")
-    print(f"   • Try ingesting your own files with ingest_file() or ingest_directory()")
+    print(f"   • Try ingesting your own files with ingest_file(), or many at once with")
+    print(f"     ingest_many() / ingest_directory()")
     print(f"   • Experiment with different search queries and categories")
     print(f"   • Use consolidate() for memory optimization")
     print(f"   • Check out the full documentation for advanced features")
@@ -7,7 +7,7 @@ import tempfile
 import unittest
 from datetime import datetime, timedelta
 
-from antaris_memory import MemorySystem, InputGate, KnowledgeSynthesizer
+from antaris_memory import MemorySystem, InputGate, KnowledgeSynthesizer, SentimentTagger, TemporalEngine
 from antaris_memory.entry import MemoryEntry
 
 
@@ -242,6 +242,18 @@ class TestInputGate(unittest.TestCase):
         # Very short content
         self.assertEqual(self.gate.classify("k"), "P3")
         self.assertEqual(self.gate.classify(""), "P3")
+        # Short text is kept only with a P2 signal; longer text defaults to P2
+        self.assertEqual(self.gate.classify("Random words"), "P3")
+        self.assertEqual(self.gate.classify("FYI: relocated"), "P2")
+        self.assertEqual(self.gate.classify("Lunch was pasta today"), "P2")
+    
+    def test_repeated_text_classified_from_cache(self):
+        self.assertEqual(self.gate.classify("We decided to use PostgreSQL"), "P1")
+        self.assertEqual(self.gate.classify("  we decided to use postgresql "), "P1")
+        self.assertEqual(self.gate._classify_text.cache_info().hits, 1)
+        # Context hints still apply to a cached text
+        self.assertEqual(self.gate.classify("We decided to use PostgreSQL",
+                                            {"source": "security-alerts"}), "P0")
     
     def test_should_store(self):
         """Test storage decision logic."""
@@ -284,6 +296,69 @@ class TestInputGate(unittest.TestCase):
         self.assertEqual(self.gate.classify("Discussion about project timeline", context), "P1")
 
 
+class TestSentimentTagger(unittest.TestCase):
+    """Test keyword-based sentiment tagging."""
+
+    def setUp(self):
+        self.tagger = SentimentTagger()
+
+    def test_scores_distinct_keyword_hits(self):
+        scores = self.tagger.analyze("Critical bug FIXED ✅ — profit up")
+        self.assertEqual(scores["positive"], 1.0)    # fixed, ✅, profit
+        self.assertEqual(scores["negative"], 0.67)   # critical, bug
+        self.assertEqual(scores["financial"], 0.33)  # profit
+        self.assertEqual(self.tagger.analyze("nothing to see"), {})
+
+    def test_automaton_matches_substring_scan(self):
+        if self.tagger._automaton is None:
+            self.skipTest("pyahocorasick not installed")
+        plain = SentimentTagger()
+        plain._automaton = None
+        for text in ["Deadline tonight, right now!", "costable planned 🚀🚀",
+                     "Strategy pivot: revenue roadmap", ""]:
+            self.assertEqual(self.tagger.analyze(text), plain.analyze(text))
+
+    def test_default_lexicon_is_built_once(self):
+        other = SentimentTagger()
+        self.assertIs(other._slots, self.tagger._slots)
+        self.assertIs(other._automaton, self.tagger._automaton)
+        custom = SentimentTagger({"positive": ["shipped"]})
+        self.assertIsNot(custom._slots, self.tagger._slots)
+        self.assertEqual(custom.analyze("We shipped it"), {"positive": 0.33})
+
+
+class TestTemporalEngine(unittest.TestCase):
+    """Test TemporalEngine date queries directly."""
+
+    def setUp(self):
+        days = ["2026-01-01", "2026-01-03", "2026-01-03", "2026-01-05", "2026-01-09"]
+        self.memories = [
+            MemoryEntry(f"Entry {i} logged on {day}", "log", i, created=f"{day}T0{i}:00:00")
+            for i, day in enumerate(days)
+        ]
+
+    def test_between_presorted_matches_scan(self):
+        for start, end in [("2026-01-03", "2026-01-05"), ("2026-01-02", "2026-01-02"),
+                           ("2025-12-01", "2027-01-01"), ("2026-01-09", "2026-01-09")]:
+            self.assertEqual(
+                TemporalEngine.between(self.memories, start, end, presorted=True),
+                TemporalEngine.between(self.memories, start, end),
+            )
+
+    def test_between_unsorted_input(self):
+        shuffled = self.memories[::-1]
+        result = TemporalEngine.between(shuffled, "2026-01-03", "2026-01-05")
+        self.assertEqual(result, self.memories[1:4])
+
+    def test_on_date_matches_created_content_or_source(self):
+        by_source = MemoryEntry("Untimed note", "notes-2026-01-05.md", 9, created="2025-06-01T00:00:00")
+        memories = self.memories + [by_source]
+        self.assertEqual(TemporalEngine.on_date(memories, "2026-01-05"),
+                         [self.memories[3], by_source])
+        # "logged on 2026-01-03" in the content, or created that day
+        self.assertEqual(TemporalEngine.on_date(memories, "2026-01-03"), self.memories[1:3])
+
+
 class TestKnowledgeSynthesizer(unittest.TestCase):
     """Test the knowledge synthesis engine."""
     
@@ -310,7 +385,49 @@ class TestKnowledgeSynthesizer(unittest.TestCase):
         # Should identify questions
         gap_text = " ".join(gaps)
         self.assertIn("question", gap_text.lower())
-    
+
+    def test_identify_gaps_counts_each_memory_once(self):
+        """A memory matching several question/TODO patterns is one item."""
+        memories = [
+            MemoryEntry("What is the plan and how does it work? TODO: must decide", "q"),
+            MemoryEntry("See Grafana dashboards, according to ops runbook", "ref"),
+        ]
+        gaps = self.synthesizer.identify_gaps(memories)
+        self.assertIn("Unanswered questions found: 1 questions need research", gaps)
+        self.assertIn("Incomplete items: 1 TODO/pending items identified", gaps)
+        refs = [g for g in gaps if g.startswith("External references")]
+        self.assertEqual(len(refs), 1)
+        self.assertIn("grafana dashboards", refs[0])
+        self.assertIn("ops runbook", refs[0])
+
+    def test_explanation_keywords_match_whole_words(self):
+        """'this' / 'analysis' must not count as explaining a term."""
+        unexplained = [
+            MemoryEntry("This service calls Kafka for analysis", "a"),
+            MemoryEntry("Kafka lag spiked this morning", "b"),
+        ]
+        gaps = self.synthesizer.identify_gaps(unexplained)
+        self.assertIn("What is kafka? (mentioned 2 times)", gaps)
+
+        explained = unexplained + [MemoryEntry("Kafka is a log broker", "c")]
+        gaps = self.synthesizer.identify_gaps(explained)
+        self.assertFalse(any(g.startswith("What is kafka") for g in gaps))
+
+    def test_identify_gaps_parallel_matches_serial(self):
+        memories = self.test_memories * 3
+        serial = self.synthesizer.identify_gaps(memories)
+        parallel = KnowledgeSynthesizer(workers=2)
+        parallel.PARALLEL_MIN_MEMORIES = 1
+        self.assertEqual(sorted(parallel.identify_gaps(memories)), sorted(serial))
+
+    def test_identify_gaps_serial_by_default(self):
+        from unittest import mock
+        synthesizer = KnowledgeSynthesizer()
+        synthesizer.PARALLEL_MIN_MEMORIES = 1
+        with mock.patch("antaris_memory.synthesis.ProcessPoolExecutor") as pool:
+            synthesizer.identify_gaps(self.test_memories)
+        pool.assert_not_called()
+
     def test_suggest_research_topics(self):
         """Test research topic suggestions."""
         suggestions = self.synthesizer.suggest_research_topics(self.test_memories, limit=3)
@@ -339,6 +456,21 @@ class TestKnowledgeSynthesizer(unittest.TestCase):
             self.assertIn("synthesis", entry.tags)
             self.assertGreater(entry.confidence, 0.5)
     
+    def test_find_related_ranks_by_shared_words(self):
+        """At least two shared 4+ char words; most overlap first, ties in order."""
+        memories = [
+            MemoryEntry("Redis cache misses after the deploy", "a"),
+            MemoryEntry("Redis cache latency spikes after deploy", "b"),
+            MemoryEntry("Only redis here", "c"),
+            MemoryEntry("Cache warmup for redis nodes", "d"),
+        ]
+        related = self.synthesizer._find_related(
+            "redis cache latency regressed after deploy", memories)
+        self.assertEqual([m.source for m in related], ["b", "a", "d"])
+        synthesized = self.synthesizer.synthesize(
+            memories, "Redis cache latency regressed after deploy", "s")
+        self.assertEqual(synthesized[0].related, [m.hash for m in related])
+
     def test_run_cycle(self):
         """Test complete synthesis cycle."""
         research_results = {
@@ -17,6 +17,9 @@ Covers:
  13. bulk_ingest with dict missing content key is skipped
  14. bulk_ingest persists to disk (searchable after)
  15. bulk_ingest handles large batch (1000 items) without error
+ 16. ingest_directory/ingest_many save the store once
+ 17. bulk_ingest calls ingest() once per distinct item
+ 18. Re-ingesting stored content builds no entries and skips the rebuild
 """
 
 import os
@@ -24,7 +27,7 @@ import tempfile
 import unittest
 from unittest.mock import MagicMock, call, patch
 
-from antaris_memory import MemorySystem
+from antaris_memory import MemoryEntry, MemorySystem
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -106,6 +109,16 @@ class TestBulkIngest(unittest.TestCase):
             # Only one copy should be stored
             self.assertEqual(count, 1)
 
+    def test_repeated_items_ingested_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            mem = _make_mem(tmp)
+            entries = [_content(1), _content(2), _content(1),
+                       _dict_entry(3), _dict_entry(3), _dict_entry(3, category="ops")]
+            with patch.object(mem, "ingest", wraps=mem.ingest) as ingest:
+                count = mem.bulk_ingest(entries)
+            self.assertEqual(ingest.call_count, 4)
+            self.assertEqual(count, 3)  # the "ops" copy has the same hash
+
     # ── 6. Single rebuild_indexes confirmed via mock ─────────────────────────
     def test_single_rebuild_confirmed(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -250,6 +263,42 @@ class TestBulkIngest(unittest.TestCase):
             self.assertGreater(count, 0)
             self.assertFalse(mem._bulk_mode_active)
 
+    # ── 16. ingest_directory / ingest_many: one save for many files ───────────
+    def test_ingest_directory_saves_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "notes")
+            os.makedirs(src)
+            for f in range(3):
+                with open(os.path.join(src, f"n{f}.md"), "w") as fh:
+                    fh.write("\n".join(f"{_content(i)} in file {f}" for i in range(150)))
+            mem = _make_mem(os.path.join(tmp, "ws"))
+            with patch.object(mem, "save", wraps=mem.save) as save:
+                count = mem.ingest_directory(src)
+            self.assertEqual(count, 450)
+            self.assertEqual(save.call_count, 1)
+            self.assertFalse(mem._bulk_mode_active)
+
+            reloaded = _make_mem(os.path.join(tmp, "ws"))
+            self.assertEqual(reloaded.load(), 450)
+            self.assertEqual(mem.ingest_many([os.path.join(src, "n0.md")]), 0)
+
+    # ── 18. Already-stored content is dropped before any per-entry work ──────
+    def test_reingest_skips_entry_construction_and_rebuild(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            mem = _make_mem(tmp)
+            batch = ["\n".join(_content(i) for i in range(50))]
+            self.assertEqual(mem.bulk_ingest(batch), 50)
+
+            with patch("antaris_memory.core_v4.MemoryEntry",
+                       wraps=MemoryEntry) as entry_cls, \
+                    patch.object(mem.index_manager, "rebuild_indexes") as rebuild, \
+                    patch.object(mem.gating, "classify") as classify:
+                self.assertEqual(mem.bulk_ingest(batch), 0)
+            entry_cls.assert_not_called()
+            classify.assert_not_called()
+            rebuild.assert_not_called()
+            self.assertEqual(len(mem.memories), 50)
+
 
 if __name__ == "__main__":
     unittest.main()
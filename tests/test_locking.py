@@ -156,11 +156,11 @@ class TestFileLock(unittest.TestCase):
                         f"Expected {4 * iterations}, got {final['count']} — lost updates detected")
     
     def test_atomic_write_with_lock(self):
-        """atomic_write_json uses locking by default."""
+        """atomic_write_json can lock around the write."""
         from antaris_memory.utils import atomic_write_json
         
         path = os.path.join(self.tmpdir, "locked_write.json")
-        atomic_write_json(path, {"key": "value"})
+        atomic_write_json(path, {"key": "value"}, lock=True)
         
         with open(path) as f:
             data = json.load(f)
@@ -169,16 +169,173 @@ class TestFileLock(unittest.TestCase):
         self.assertFalse(os.path.isdir(path + ".lock"))
     
     def test_atomic_write_without_lock(self):
-        """atomic_write_json can skip locking."""
+        """atomic_write_json does not lock by default."""
         from antaris_memory.utils import atomic_write_json
         
         path = os.path.join(self.tmpdir, "unlocked_write.json")
-        atomic_write_json(path, {"key": "value"}, lock=False)
-        
+        atomic_write_json(path, {"key": "value"})
+        self.assertFalse(os.path.isdir(path + ".lock"))
+
         with open(path) as f:
             data = json.load(f)
         self.assertEqual(data["key"], "value")
 
+    def test_atomic_write_compact(self):
+        from antaris_memory.utils import atomic_write_json
+
+        path = os.path.join(self.tmpdir, "compact.json")
+        atomic_write_json(path, {"key": ["a", "é"]}, compact=True)
+        with open(path, "rb") as f:
+            raw = f.read()
+        self.assertEqual(raw, b'{"key":["a","\\u00e9"]}')
+
+    def test_atomic_write_skips_unchanged_payload(self):
+        """Re-saving identical data leaves the file untouched."""
+        from antaris_memory.utils import atomic_write_json
+
+        path = os.path.join(self.tmpdir, "idempotent.json")
+        atomic_write_json(path, {"key": "value"})
+        inode = os.stat(path).st_ino
+        atomic_write_json(path, {"key": "value"})
+        self.assertEqual(os.stat(path).st_ino, inode)
+
+        # Changed data, or a file modified behind our back, is rewritten
+        atomic_write_json(path, {"key": "other"})
+        self.assertNotEqual(os.stat(path).st_ino, inode)
+        with open(path, "w") as f:
+            f.write("{}")
+        atomic_write_json(path, {"key": "other"})
+        with open(path) as f:
+            self.assertEqual(json.load(f), {"key": "other"})
+
+    def test_atomic_write_non_durable_skips_fsync(self):
+        from unittest import mock
+        from antaris_memory.utils import atomic_write_json, batch_writes
+
+        path = os.path.join(self.tmpdir, "cache.json")
+        with mock.patch("antaris_memory.utils.os.fsync") as fsync:
+            atomic_write_json(path, {"v": 1}, durable=False)
+            with batch_writes():
+                atomic_write_json(path, {"v": 2}, durable=False)
+            fsync.assert_not_called()
+            atomic_write_json(path, {"v": 3})
+            self.assertEqual(fsync.call_count, 2)  # file + directory
+        with open(path) as f:
+            self.assertEqual(json.load(f), {"v": 3})
+
+    def test_atomic_write_recreates_removed_directory(self):
+        import shutil
+        from antaris_memory.utils import atomic_write_json
+
+        sub = os.path.join(self.tmpdir, "sub")
+        path = os.path.join(sub, "state.json")
+        atomic_write_json(path, {"v": 1})
+        shutil.rmtree(sub)
+        atomic_write_json(path, {"v": 2})
+        with open(path) as f:
+            self.assertEqual(json.load(f), {"v": 2})
+
+    def test_batch_writes_commit_on_exit(self):
+        from antaris_memory.utils import atomic_write_json, batch_writes
+
+        a = os.path.join(self.tmpdir, "a.json")
+        b = os.path.join(self.tmpdir, "b.json")
+        atomic_write_json(a, {"v": 0})
+        with batch_writes():
+            atomic_write_json(a, {"v": 1})
+            atomic_write_json(a, {"v": 2})
+            with batch_writes():
+                atomic_write_json(b, {"v": 3})
+            # Nothing lands until the outermost block exits
+            with open(a) as f:
+                self.assertEqual(json.load(f), {"v": 0})
+            self.assertFalse(os.path.exists(b))
+
+        for path, expected in ((a, {"v": 2}), (b, {"v": 3})):
+            with open(path) as f:
+                self.assertEqual(json.load(f), expected)
+        leftovers = [n for n in os.listdir(self.tmpdir) if n.endswith(".tmp")]
+        self.assertEqual(leftovers, [])
+
+    def test_batch_writes_last_write_wins_over_unchanged_skip(self):
+        from antaris_memory.utils import atomic_write_json, batch_writes
+
+        path = os.path.join(self.tmpdir, "flip.json")
+        atomic_write_json(path, {"v": 0})
+        with batch_writes():
+            atomic_write_json(path, {"v": 1})
+            # Matches the file on disk, but not the pending write
+            atomic_write_json(path, {"v": 0})
+        with open(path) as f:
+            self.assertEqual(json.load(f), {"v": 0})
+
+    def test_remove_file_deferred_inside_batch(self):
+        from antaris_memory.utils import atomic_write_json, batch_writes, remove_file
+
+        old = os.path.join(self.tmpdir, "old.json")
+        new = os.path.join(self.tmpdir, "new.json")
+        atomic_write_json(old, {"v": 0})
+        with batch_writes():
+            atomic_write_json(new, {"v": 1})
+            remove_file(old)
+            self.assertTrue(os.path.exists(old))
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(new))
+        remove_file(old)  # already gone: no error
+
+    def test_locked_read_json(self):
+        from antaris_memory.utils import atomic_write_json, locked_read_json
+
+        path = os.path.join(self.tmpdir, "read.json")
+        self.assertEqual(locked_read_json(path, default={}), {})
+        atomic_write_json(path, {"text": "caf\u00e9", "n": [1, 2]})
+        self.assertEqual(locked_read_json(path), {"text": "caf\u00e9", "n": [1, 2]})
+        self.assertFalse(os.path.isdir(path + ".lock"))
+
+    def test_append_jsonl(self):
+        from antaris_memory.utils import append_jsonl
+
+        path = os.path.join(self.tmpdir, "log.jsonl")
+        append_jsonl(path, {"n": 1, "text": "caf\u00e9"})
+        append_jsonl(path, {"n": 2}, fsync=False)
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records, [{"n": 1, "text": "caf\u00e9"}, {"n": 2}])
+
+
+class TestAsyncFlusher(unittest.TestCase):
+
+    def test_coalesces_and_flushes_in_background(self):
+        from antaris_memory.utils import AsyncFlusher
+
+        flushed = threading.Event()
+        calls = []
+
+        def flush():
+            calls.append(1)
+            flushed.set()
+
+        flusher = AsyncFlusher(flush, interval=0.05)
+        try:
+            for _ in range(5):
+                flusher.mark_dirty()
+            self.assertTrue(flushed.wait(5))
+            self.assertFalse(flusher.dirty)
+            self.assertEqual(len(calls), 1)
+        finally:
+            flusher.close()
+
+    def test_close_flushes_pending(self):
+        from antaris_memory.utils import AsyncFlusher
+
+        calls = []
+        flusher = AsyncFlusher(lambda: calls.append(1), interval=60)
+        flusher.mark_dirty()
+        flusher.close()
+        self.assertEqual(calls, [1])
+        flusher.close()  # idempotent, nothing left to flush
+        self.assertEqual(calls, [1])
+
 
 if __name__ == "__main__":
     unittest.main()
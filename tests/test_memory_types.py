@@ -165,6 +165,15 @@ class TestDecayTypeAwareness(unittest.TestCase):
         hl = self.decay.effective_half_life(e)
         self.assertEqual(hl, 7.0)
 
+    def test_score_batch_matches_score(self):
+        entries = [self._entry(t, days_old=d)
+                   for d in (0, 3, 40) for t in list(MEMORY_TYPE_CONFIGS) + ["custom"]]
+        entries[-1].type_metadata = {"decay_multiplier": 4.0}
+        entries[-1].access_count = 3
+        now = datetime.now()
+        self.assertEqual(self.decay.score_batch(entries, now),
+                         [self.decay.score(e, now) for e in entries])
+
     def test_type_multiplier_ordering(self):
         """mistake > preference ≈ procedure > episodic ≈ fact"""
         entries = {t: self._entry(t, days_old=20) for t in MEMORY_TYPE_CONFIGS}
@@ -216,6 +225,26 @@ class TestMemoryEntryTypeFields(unittest.TestCase):
         e2 = MemoryEntry.from_dict(d)
         self.assertEqual(e2.memory_type, "preference")
 
+    def test_from_dict_keeps_stored_hash(self):
+        e = MemoryEntry("content with a legacy stored hash", "notes.md", 3)
+        d = e.to_dict()
+        self.assertEqual(MemoryEntry.from_dict(d).hash, e.hash)
+        d["hash"] = "a1b2c3d4e5f6"  # pre-BLAKE2b 12-char store
+        self.assertEqual(MemoryEntry.from_dict(d).hash, "a1b2c3d4e5f6")
+        del d["hash"]
+        self.assertEqual(MemoryEntry.from_dict(d).hash, e.hash)
+
+    def test_from_dict_shares_label_strings(self):
+        import json
+        e = MemoryEntry("content with shared labels", "notes/2026-02.md", 1, "ops",
+                        memory_type="fact")
+        e.tags = ["deploy"]
+        a, b = (MemoryEntry.from_dict(json.loads(json.dumps(e.to_dict()))) for _ in range(2))
+        for field in ("source", "category", "memory_type"):
+            self.assertIs(getattr(a, field), getattr(b, field))
+        self.assertIs(a.tags[0], b.tags[0])
+        self.assertEqual(MemoryEntry.from_dict({"content": "x", "tags": None}).tags, [])
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Sprint 2 — Typed Ingest Methods
@@ -189,6 +189,23 @@ class TestWAL(unittest.TestCase):
         for entry in pending:
             self.assertIn("content", entry)
 
+    def test_multiline_ingest_journals_every_line(self):
+        """A multi-line ingest() lands all of its lines in the WAL."""
+        mem = _make_mem(self.tmp, enable_read_cache=False)
+        mem._wal.flush_interval = 10_000
+
+        count = mem.ingest(
+            "First batched WAL line about deployment pipelines\n"
+            "Second batched WAL line about database migrations\n"
+            "Third batched WAL line about release scheduling",
+            source="wal_test",
+        )
+        self.assertEqual(count, 3)
+        self.assertEqual(mem._wal.pending_count(), 3)
+        contents = [e["content"] for e in mem._wal.load_pending()]
+        self.assertEqual(len(contents), 3)
+        self.assertTrue(contents[0].startswith("First"))
+
     def test_flush_compacts_wal_into_memories(self):
         """flush() saves in-memory state to disk and clears the WAL."""
         mem = _make_mem(self.tmp, enable_read_cache=False)
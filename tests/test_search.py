@@ -43,6 +43,24 @@ class TestSearchEngine(unittest.TestCase):
         top = results[0]
         self.assertTrue(len(top.matched_terms) > 0)
     
+    def test_query_matcher_scores_like_full_tokenization(self):
+        from collections import Counter
+        from antaris_memory.search import _term_matcher
+        entries = self.memories + [
+            MemoryEntry("database_backup and databases, data-driven DATA", "ops", 1, "tactical"),
+            MemoryEntry("Café data: straße café_data", "ops", 1, "tactical"),
+        ]
+        self.engine.build_index(entries)
+        for query in ("data", "database backup", "café data", "postgresql database"):
+            tokens = self.engine._tokenize(query)
+            counts = Counter(tokens)
+            matcher = _term_matcher(tuple(counts))
+            for mem in entries:
+                self.assertEqual(
+                    self.engine._score_entry(mem, tokens, query.lower(), counts, matcher),
+                    self.engine._score_entry(mem, tokens, query.lower(), counts),
+                    (query, mem.content))
+    
     def test_category_filter(self):
         results = self.engine.search("deploy staging", self.memories, category="tactical")
         for r in results:
@@ -99,6 +117,69 @@ class TestSearchEngine(unittest.TestCase):
         self.assertEqual(r.content, r.entry.content)
         self.assertEqual(r.source, r.entry.source)
         self.assertEqual(r.confidence, r.relevance)
+    
+    def test_tag_boost_matches_whole_tokens(self):
+        tagged = MemoryEntry("Weekly sync about the release.", "notes", 1, "operational")
+        tagged.tags = ["release_planning"]
+        partial = MemoryEntry("Weekly sync about the release.", "notes", 2, "operational")
+        partial.tags = ["releases"]
+        memories = [tagged, partial]
+        results = self.engine.search("planning release", memories)
+        self.assertEqual(results[0].entry, tagged)
+        self.assertIn("tag:planning", results[0].matched_terms)
+        self.assertNotIn("tag:release", results[1].matched_terms)
+    
+    def test_repeated_query_terms_scored_once_with_weight(self):
+        once = self.engine.search("migration PostgreSQL", self.memories)[0]
+        twice = self.engine.search("migration PostgreSQL PostgreSQL", self.memories)[0]
+        self.assertEqual(twice.matched_terms.count("postgresql"), 1)
+        self.assertGreater(twice.score, once.score)
+    
+    def test_top_k_matches_full_ranking(self):
+        full = self.engine.search("PostgreSQL database migration strategy", self.memories, limit=100)
+        top2 = self.engine.search("PostgreSQL database migration strategy", self.memories, limit=2)
+        self.assertEqual([r.entry for r in top2], [r.entry for r in full[:2]])
+        self.assertEqual(top2[0].relevance, 1.0)
+    
+    def test_postings_resolve_by_content(self):
+        # Fresh objects with identical content (e.g. after a reload) must
+        # still be found without an index rebuild.
+        copies = [MemoryEntry.from_dict(m.to_dict()) for m in self.memories]
+        results = self.engine.search("PostgreSQL", copies)
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(r.entry in copies for r in results))
+    
+    def test_add_documents_matches_full_rebuild(self):
+        from unittest import mock
+        self.engine.search("database", self.memories)  # builds the index
+        extra = [MemoryEntry("Database sharding plan for the PostgreSQL cluster.", "ops", 1),
+                 MemoryEntry("Redis cache sits in front of the database.", "ops", 2)]
+        corpus = self.memories + extra
+        self.engine.add_documents(extra)
+        fresh = SearchEngine()
+        fresh.build_index(corpus)
+        self.assertEqual(self.engine._doc_freqs, fresh._doc_freqs)
+        self.assertEqual(self.engine._postings, fresh._postings)
+        self.assertEqual(self.engine._avg_doc_len, fresh._avg_doc_len)
+        with mock.patch.object(self.engine, "build_index") as rebuild:
+            got = self.engine.search("database cache", corpus)
+        rebuild.assert_not_called()
+        want = fresh.search("database cache", corpus)
+        self.assertEqual([(r.entry, r.score) for r in got], [(r.entry, r.score) for r in want])
+    
+    def test_reordered_list_still_fully_searched(self):
+        # Same contents in a different order: no rebuild, so the positions
+        # recorded at index time no longer apply and the list is scanned.
+        first = self.engine.search("PostgreSQL", self.memories)
+        again = self.engine.search("PostgreSQL", self.memories[::-1])
+        self.assertEqual({r.entry for r in again}, {r.entry for r in first})
+    
+    def test_source_boost_uses_source_tokens(self):
+        a = MemoryEntry("Cache eviction policy notes.", "meeting_notes", 1)
+        b = MemoryEntry("Cache eviction policy notes.", "meetingroom", 1)
+        results = self.engine.search("meeting cache", [a, b])
+        self.assertEqual(results[0].entry, a)
+        self.assertGreater(results[0].score, results[1].score)
 
 
 class TestMemorySystemSearch(unittest.TestCase):
@@ -163,6 +244,92 @@ class TestMemorySystemSearch(unittest.TestCase):
         self.assertTrue(len(results) > 0)
         self.assertIn("postgresql", results[0].content.lower())
 
+    def test_load_defers_index_build_to_first_search(self):
+        from unittest import mock
+        self.mem.save()
+        with mock.patch.object(SearchEngine, "build_index",
+                               autospec=True, side_effect=SearchEngine.build_index) as build:
+            mem2 = MemorySystem(self.tmpdir, half_life=7.0)
+            mem2.load()
+            build.assert_not_called()
+            self.assertTrue(mem2.search("PostgreSQL"))
+            mem2.search("database")
+        self.assertEqual(build.call_count, 1)
+
+    def test_ingest_after_search_updates_index_in_place(self):
+        from unittest import mock
+        self.mem.search("PostgreSQL")
+        with mock.patch.object(self.mem.search_engine, "build_index") as rebuild:
+            self.mem.ingest("Kubernetes autoscaling configured for the API tier.")
+            results = self.mem.search("kubernetes")
+        rebuild.assert_not_called()
+        self.assertEqual(len(results), 1)
+
+
+
+class TestIndexManagerSearch(unittest.TestCase):
+    """File-based indexes: filters are applied before text scoring."""
+
+    def setUp(self):
+        from antaris_memory import IndexManager
+        self.tmpdir = tempfile.mkdtemp()
+        self.index = IndexManager(self.tmpdir)
+        for i in range(30):
+            entry = MemoryEntry(f"Database tuning note number {i}", "notes", 1, "ops")
+            entry.tags = ["db"]
+            entry.created = "2026-02-10T10:00:00"
+            self.index.add_memory(entry)
+        target = MemoryEntry("Database choice for the python service", "notes", 1, "ops")
+        target.tags = ["python", "db"]
+        target.created = "2026-02-12T10:00:00"
+        self.index.add_memory(target)
+        self.target = target.hash
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_filtered_match_not_starved_by_broad_query(self):
+        results = self.index.search("database", tags=["python"], limit=1)
+        self.assertEqual([h for h, _ in results], [self.target])
+
+    def test_tag_all_and_date_range(self):
+        self.assertEqual(self.index.tag_index.get_memories_by_tags(["db", "python"], mode="all"),
+                         [self.target])
+        self.assertEqual(self.index.tag_index.get_memories_by_tags(["db", "missing"], mode="all"), [])
+        results = self.index.search("", tags=["db"], date_range=("2026-02-11", "2026-02-13"))
+        self.assertEqual(results, [(self.target, 1.0)])
+        self.assertEqual(self.index.search("database", date_range=("2027-01-01", "2027-12-31")), [])
+
+    def test_sync_reindexes_only_changes_and_matches_rebuild(self):
+        from unittest import mock
+        from antaris_memory import IndexManager
+        memories = [MemoryEntry(f"Release note {i} about caching", "notes", i, "ops")
+                    for i in range(10)]
+        self.index.sync(memories)  # first sync is a full rebuild
+        self.assertTrue(self.index.dirty)
+        self.index.save_all_indexes()
+        self.assertFalse(self.index.dirty)
+
+        self.index.sync(memories)
+        self.assertFalse(self.index.dirty)  # nothing changed, nothing to write
+
+        memories[0].tags.append("cache")
+        memories[1].content = "Release note about sharding"
+        del memories[2]
+        memories.append(MemoryEntry("Fresh note on compaction", "notes", 99, "ops"))
+        with mock.patch.object(self.index, "rebuild_indexes") as rebuild, \
+                mock.patch.object(self.index.search_index, "add_memory",
+                                  wraps=self.index.search_index.add_memory) as add:
+            self.index.sync(memories)
+        rebuild.assert_not_called()
+        self.assertEqual(add.call_count, 3)
+
+        fresh = IndexManager(tempfile.mkdtemp())
+        fresh.rebuild_indexes(memories)
+        self.assertEqual(self.index.search_index.word_index, fresh.search_index.word_index)
+        self.assertEqual(self.index.tag_index.memory_to_tags, fresh.tag_index.memory_to_tags)
+        self.assertEqual(self.index.date_index.memory_to_date, fresh.date_index.memory_to_date)
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,257 @@
+"""Tests for the shard manager and shard index."""
+
+import os
+import tempfile
+import unittest
+
+from antaris_memory.entry import MemoryEntry
+from antaris_memory.sharding import ShardKey, ShardManager
+
+
+def _entry(content, created, category="general", tags=None):
+    m = MemoryEntry(content, source="test", category=category, created=created)
+    m.tags = list(tags or [])
+    return m
+
+
+class TestShardCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.manager = ShardManager(self.tmpdir)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _save(self, n):
+        keys = []
+        for i in range(n):
+            key = ShardKey(f"2026-{i + 1:02d}", "general")
+            self.manager.save_shard(key, [_entry(f"memory {i}", f"2026-{i + 1:02d}-01T00:00:00")])
+            keys.append(key)
+        return keys
+
+    def test_cache_is_bounded(self):
+        for key in self._save(12):
+            self.manager.load_shard(key)
+        self.assertEqual(len(self.manager._shard_cache), ShardManager.MAX_CACHED_SHARDS)
+
+    def test_eviction_is_least_recently_used(self):
+        keys = self._save(11)
+        for key in keys[:10]:
+            self.manager.load_shard(key)
+        # Touch the oldest entry so it becomes most recently used
+        self.manager.load_shard(keys[0])
+        self.manager.load_shard(keys[10])
+        self.assertIn(keys[0], self.manager._shard_cache)
+        self.assertNotIn(keys[1], self.manager._shard_cache)
+
+    def test_load_shards_returns_one_list_per_key_in_order(self):
+        keys = list(reversed(self._save(3)))
+        loaded = self.manager.load_shards(keys)
+        self.assertEqual([[m.content for m in ms] for ms in loaded],
+                         [["memory 2"], ["memory 1"], ["memory 0"]])
+        self.assertEqual(self.manager.load_shards([]), [])
+
+    def test_get_all_memories_keeps_index_order(self):
+        keys = self._save(12)
+        for key in keys:
+            self.manager.index.add_shard(key, self.manager.load_shard(key))
+        contents = [m.content for m in self.manager.get_all_memories()]
+        self.assertEqual(contents, [f"memory {i}" for i in range(12)])
+        self.assertEqual(len(self.manager.get_all_memories(limit=3)), 3)
+
+
+class TestShardPersistence(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.manager = ShardManager(self.tmpdir)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_round_trip_preserves_entries(self):
+        key = ShardKey("2026-02", "work")
+        original = [
+            _entry("Deploy fixed ✅ — unicode survives", "2026-02-01T10:00:00", "work", ["deploy"]),
+            _entry("Second memory", "2026-02-02T10:00:00", "work"),
+        ]
+        original[0].sentiment = {"positive": 0.67}
+        self.manager.save_shard(key, original)
+        self.manager._shard_cache.clear()
+
+        loaded = self.manager.load_shard(key)
+        self.assertEqual([m.to_dict() for m in loaded], [m.to_dict() for m in original])
+
+    def test_stdlib_fallback_reads_same_file(self):
+        import json
+        key = ShardKey("2026-02", "work")
+        self.manager.save_shard(key, [_entry("Plain entry", "2026-02-01T10:00:00", "work")])
+        with open(os.path.join(self.manager.shards_dir, key.filename), "rb") as f:
+            data = json.loads(f.read())
+        self.assertEqual(data["memories"][0]["content"], "Plain entry")
+
+    def test_shards_written_compact_and_indented_shards_still_load(self):
+        import json
+        key = ShardKey("2026-02", "work")
+        self.manager.save_shard(key, [_entry("Compact entry", "2026-02-01T10:00:00", "work")])
+        path = os.path.join(self.manager.shards_dir, key.filename)
+        with open(path, "rb") as f:
+            raw = f.read()
+        self.assertNotIn(b"\n", raw)
+        data = json.loads(raw)
+
+        # Shards saved by earlier versions are pretty-printed
+        data["memories"][0]["content"] = "Indented entry"
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        self.manager._shard_cache.clear()
+        self.assertEqual([m.content for m in self.manager.load_shard(key)], ["Indented entry"])
+
+    def test_compressed_round_trip_and_format_switch(self):
+        import gzip
+        key = ShardKey("2026-02", "work")
+        entries = [_entry("Compressed shard entry", "2026-02-01T10:00:00", "work")]
+        self.manager.save_shard(key, entries)
+
+        compressed = ShardManager(self.tmpdir, compress=True)
+        path = compressed.save_shard(key, entries)
+        self.assertTrue(path.endswith(".json.gz"))
+        with open(path, "rb") as f:
+            self.assertEqual(gzip.decompress(f.read())[:1], b"{")
+        # The plain copy is removed so readers can't pick up stale data
+        self.assertFalse(os.path.exists(os.path.join(self.manager.shards_dir, key.filename)))
+
+        # A manager configured for plain JSON still reads the gzip'd shard
+        reader = ShardManager(self.tmpdir)
+        self.assertEqual([m.content for m in reader.load_shard(key)], ["Compressed shard entry"])
+
+    def test_format_switch_inside_batch_writes(self):
+        from antaris_memory.utils import batch_writes
+        key = ShardKey("2026-02", "work")
+        entries = [_entry("Batched shard entry", "2026-02-01T10:00:00", "work")]
+        self.manager.save_shard(key, entries)
+        plain = os.path.join(self.manager.shards_dir, key.filename)
+
+        compressed = ShardManager(self.tmpdir, compress=True)
+        compressed.index.add_shard(key, entries)
+        with batch_writes():
+            path = compressed.save_shard(key, entries)
+            # Nothing lands, or disappears, until the batch commits
+            self.assertTrue(os.path.exists(plain))
+            self.assertFalse(os.path.exists(path))
+        self.assertFalse(os.path.exists(plain))
+        self.assertEqual(compressed.index.shards[key]["size_bytes"], os.path.getsize(path))
+        self.assertEqual([m.content for m in ShardManager(self.tmpdir).load_shard(key)],
+                         ["Batched shard entry"])
+
+    def test_memory_system_save_inside_batch_writes(self):
+        from antaris_memory import MemorySystem
+        from antaris_memory.utils import batch_writes
+        workspace = os.path.join(self.tmpdir, "ws")
+        mem = MemorySystem(workspace)
+        with batch_writes():
+            mem.ingest("PostgreSQL replica handles the reporting workload")
+            mem.save()
+            mem.ingest("Redis cache sits in front of the session store")
+            mem.save()
+        self.assertEqual(MemorySystem(workspace).load(), 2)
+
+    def test_compressed_store_validates(self):
+        from antaris_memory import MemorySystem
+        workspace = os.path.join(self.tmpdir, "ws")
+        mem = MemorySystem(workspace, compress_shards=True)
+        mem.ingest("PostgreSQL replica handles the reporting workload")
+        mem.save()
+        self.assertEqual(mem.validate_data()["status"], "valid")
+
+        shards_dir = os.path.join(workspace, "shards")
+        for name in os.listdir(shards_dir):
+            os.remove(os.path.join(shards_dir, name))
+        self.assertEqual(mem.validate_data()["status"], "invalid")
+
+
+class TestFindRelevantShards(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        manager = ShardManager(self.tmpdir)
+        entries = [
+            _entry("Postgres tuning notes", "2026-01-10T00:00:00", "database", ["Postgres"]),
+            _entry("Quarterly budget review", "2026-02-10T00:00:00", "finance", ["budget"]),
+            _entry("Random daily note", "2026-03-10T00:00:00"),
+        ]
+        for key, group in manager.shard_memories(entries).items():
+            manager.save_shard(key, group)
+            manager.index.add_shard(key, group)
+        manager.index.save_index()
+        # Reload from disk so the index arrays are rebuilt by _load_index
+        self.index = ShardManager(self.tmpdir).index
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_topic_match_is_case_insensitive(self):
+        found = self.index.find_relevant_shards("postgres slow")
+        self.assertIn(ShardKey("2026-01", "database"), found)
+        self.assertNotIn(ShardKey("2026-02", "finance"), found)
+        # General shards are always candidates
+        self.assertIn(ShardKey("2026-03", "general"), found)
+
+    def test_date_range_and_topic_filter(self):
+        found = self.index.find_relevant_shards("", date_range=("2026-02-01", "2026-03-31"))
+        self.assertEqual(found, [ShardKey("2026-03", "general"), ShardKey("2026-02", "finance")])
+        found = self.index.find_relevant_shards("", topic_filter="FIN")
+        self.assertEqual(found, [ShardKey("2026-02", "finance")])
+
+    def test_reregistered_shard_drops_stale_topics(self):
+        key = ShardKey("2026-01", "database")
+        self.index.add_shard(key, [_entry("Moved to MySQL", "2026-01-11T00:00:00", "database", ["mysql"])])
+        self.assertIn(key, self.index.find_relevant_shards("mysql"))
+        self.assertNotIn(key, self.index.find_relevant_shards("postgres"))
+
+
+class TestSearchShards(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.manager = ShardManager(self.tmpdir)
+        entries = [
+            _entry("Cache eviction bug in the cache layer", "2026-01-05T00:00:00"),
+            _entry("Lunch with the team", "2026-01-06T00:00:00"),
+            _entry("Cache warmup script written", "2026-02-05T00:00:00"),
+            _entry("Quarterly planning notes", "2026-03-05T00:00:00"),
+        ]
+        for key, group in self.manager.shard_memories(entries).items():
+            self.manager.save_shard(key, group)
+            self.manager.index.add_shard(key, group)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_results_ranked_by_bm25(self):
+        results = self.manager.search_shards("cache eviction", limit=10)
+        self.assertEqual([m.content for m in results],
+                         ["Cache eviction bug in the cache layer", "Cache warmup script written"])
+
+    def test_upper_bound_covers_every_score(self):
+        from collections import Counter
+        from antaris_memory.search import SearchEngine
+        query = "cache eviction planning"
+        counts = Counter(SearchEngine()._tokenize(query))
+        for key in self.manager.index.shards:
+            bound = self.manager.index.upper_bound(key, counts)
+            for r in SearchEngine().search(query, self.manager.load_shard(key), min_score=0.0):
+                self.assertLessEqual(r.score, bound)
+        # The March shard has none of the query terms except "planning"
+        self.assertEqual(self.manager.index.upper_bound(ShardKey("2026-03", "general"),
+                                                        Counter(["cache"])), 0)
+
+    def test_shards_without_query_terms_are_not_loaded(self):
+        self.manager.search_shards("warmup", limit=1)
+        self.assertEqual(list(self.manager._shard_cache), [ShardKey("2026-02", "general")])
+
+
+if __name__ == "__main__":
+    unittest.main()
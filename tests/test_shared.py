@@ -1,5 +1,6 @@
 """Tests for SharedMemoryPool — multi-agent shared memory."""
 
+import json
 import os
 import shutil
 import tempfile
@@ -137,6 +138,28 @@ class TestSharedMemoryPool(unittest.TestCase):
         self.assertTrue(len(conflicts) > 0)
         self.assertEqual(conflicts[0]["type"], "contradiction")
 
+    def test_duplicate_write_skips_conflict_check(self):
+        self.pool.register_agent("forge", "write")
+        self.pool.register_agent("pixel", "write")
+        text = "We should not use PostgreSQL for the database project deployment"
+        self.pool.write("forge", "We should use PostgreSQL for the database project deployment")
+        self.assertIsNotNone(self.pool.write("pixel", text))
+        self.assertIsNone(self.pool.write("pixel", text))
+        self.assertEqual(len(self.pool.get_conflicts()), 1)
+
+    def test_conflict_signals_match_whole_words(self):
+        self.pool.register_agent("forge", "write")
+        self.pool.register_agent("pixel", "write")
+
+        # "agree" inside "disagree" is not an affirmation
+        self.pool.write("forge", "Both teams disagree about the caching layer rollout")
+        self.pool.write("pixel", "Platform and infra disagree about the caching layer rollout")
+        self.assertEqual(self.pool.get_conflicts(), [])
+
+        self.pool.write("pixel", "We can't ship the caching layer rollout this week")
+        self.pool.write("forge", "We can ship the caching layer rollout this week")
+        self.assertEqual(len(self.pool.get_conflicts()), 1)
+
     def test_resolve_conflict(self):
         self.pool.register_agent("a1", "write")
         self.pool.register_agent("a2", "write")
@@ -178,6 +201,78 @@ class TestSharedMemoryPool(unittest.TestCase):
         self.assertEqual(count, 1)
         self.assertIn("moro", pool2.permissions)
 
+    def test_unsaved_writes_replayed_from_wal(self):
+        self.pool.register_agent("moro", "admin")
+        self.pool.write("moro", "Snapshot decision about the storage backend")
+        self.pool.save()
+        self.assertFalse(self.pool._wal.exists())
+
+        # Written but never saved (e.g. the process crashed)
+        self.pool.write("moro", "Journaled decision about the retry policy")
+
+        pool2 = SharedMemoryPool(self.tmpdir, "test")
+        self.assertEqual(pool2.load(), 2)
+        self.assertIn("moro", pool2.permissions)
+        self.assertEqual(len(pool2._hashes), 2)
+
+    def test_wal_auto_flushes_to_pool_file(self):
+        self.pool._wal.flush_interval = 3
+        self.pool.register_agent("moro", "admin")
+        for i in range(3):
+            self.pool.write("moro", f"Auto-flushed memory number {i}")
+        self.assertTrue(os.path.exists(self.pool.state_path))
+        self.assertFalse(self.pool._wal.exists())
+
+    def test_unloaded_instance_does_not_overwrite_pool_file(self):
+        self.pool.register_agent("moro", "admin")
+        for i in range(3):
+            self.pool.write("moro", f"Saved decision number {i} about storage")
+        self.pool.save()
+
+        # New instance on the same pool, load() never called
+        pool2 = SharedMemoryPool(self.tmpdir, "test")
+        pool2.register_agent("moro", "admin")
+        for i in range(50):
+            pool2.write("moro", f"Later decision number {i} about retries")
+        with open(self.pool.state_path) as f:
+            self.assertEqual(json.load(f)["memory_count"], 3)
+        self.assertTrue(pool2._wal.exists())
+
+        # Nothing lost: the snapshot plus the journaled writes
+        pool3 = SharedMemoryPool(self.tmpdir, "test")
+        self.assertEqual(pool3.load(), 53)
+        pool3._wal.flush_interval = 1
+        pool3.write("moro", "Decision written after a full load")
+        with open(self.pool.state_path) as f:
+            self.assertEqual(json.load(f)["memory_count"], 54)
+
+    def test_on_date_respects_namespaces(self):
+        from antaris_memory.temporal import TemporalEngine
+        self.pool.register_agent("a1", "write", ["ops", "shared"])
+        self.pool.register_agent("a2", "write")
+        self.pool.write("a1", "Outage postmortem scheduled for 2026-03-14", namespace="ops")
+        self.pool.write("a2", "Release freeze starts 2026-03-14 for everyone")
+        today = self.pool.memories[0].created[:10]
+
+        self.assertEqual(len(self.pool.on_date("a1", "2026-03-14")), 2)
+        self.assertEqual(len(self.pool.on_date("a2", "2026-03-14")), 1)
+        self.assertEqual(len(self.pool.on_date("a1", "2026-03-14", namespace="ops")), 1)
+        self.assertEqual(self.pool.on_date("a1", today),
+                         TemporalEngine.on_date(self.pool.memories, today))
+        self.assertEqual(len(self.pool.on_date("a1", "2026-03")), 2)
+
+        # In-place edits are seen by full and partial dates alike
+        self.pool.memories[0].content = "Outage postmortem moved to 2026-04-02"
+        self.assertEqual(len(self.pool.on_date("a1", "2026-03-14")), 1)
+        self.assertEqual(len(self.pool.on_date("a1", "2026-03")), 1)
+        self.assertEqual(len(self.pool.on_date("a1", "2026-04-02")), 1)
+        self.pool.memories[0].content = "Outage postmortem scheduled for 2026-03-14"
+
+        self.pool.save()
+        pool2 = SharedMemoryPool(self.tmpdir, "test")
+        pool2.load()
+        self.assertEqual(len(pool2.on_date("a1", "2026-03-14")), 2)
+
     def test_stats(self):
         self.pool.register_agent("a1", "write", ["shared", "private"])
         self.pool.register_agent("a2", "write")
@@ -191,6 +286,19 @@ class TestSharedMemoryPool(unittest.TestCase):
         self.assertEqual(stats["registered_agents"], 2)
         self.assertIn("shared", stats["namespaces"])
 
+    def test_stats_after_load_and_propagate(self):
+        self.pool.register_agent("a1", "write", ["shared", "private"])
+        self.pool.write("a1", "Cache invalidation strategy for the edge tier",
+                        namespace="private")
+        self.pool.propagate("a1", "shared")
+        self.pool.save()
+
+        pool2 = SharedMemoryPool(self.tmpdir, "test")
+        pool2.load()
+        stats = pool2.stats()
+        self.assertEqual(stats["namespaces"], {"private": 1, "shared": 1})
+        self.assertEqual(stats["memories_by_agent"], {"a1": 2})
+
     def test_remove_agent(self):
         self.pool.register_agent("admin", "admin")
         self.pool.register_agent("temp", "write")
@@ -206,6 +314,30 @@ class TestSharedMemoryPool(unittest.TestCase):
         self.assertFalse(
             self.pool.remove_agent("other", requester="writer"))
 
+    def test_audit_log_is_appended_jsonl(self):
+        import json
+        self.pool.register_agent("moro", "admin")
+        self.pool.write("moro", "Audit trail entry for the shared pool")
+
+        with open(self.pool.audit_path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([r["action"] for r in records], ["register", "write"])
+        self.assertIn("T", records[0]["timestamp"])  # ISO formatted
+
+        # A new pool instance picks up the tail of the existing log
+        pool2 = SharedMemoryPool(self.tmpdir, "test")
+        self.assertEqual(pool2.get_audit_log(), records)
+        self.assertEqual(pool2.get_audit_log(limit=1), records[-1:])
+
+    def test_audit_log_rotates(self):
+        self.pool.AUDIT_KEEP = 5
+        self.pool.AUDIT_ROTATE_AT = 10
+        self.pool._audit_ring = type(self.pool._audit_ring)(maxlen=5)
+        for i in range(11):
+            self.pool.register_agent(f"agent{i}")
+        with open(self.pool.audit_path) as f:
+            self.assertEqual(len(f.readlines()), 5)
+
 
 if __name__ == "__main__":
     unittest.main()
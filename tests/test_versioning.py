@@ -82,6 +82,26 @@ class TestVersionTracker(unittest.TestCase):
             on_disk = json.load(f)
         self.assertEqual(on_disk["count"], 1)
     
+    def test_safe_update_with_content_hash(self):
+        tracker = VersionTracker(use_content_hash=True)
+        result = tracker.safe_update(
+            self.path,
+            lambda data: {**data, "count": data["count"] + 1}
+        )
+        self.assertEqual(result["count"], 1)
+
+    def test_safe_update_content_check_never_hashes(self):
+        from unittest import mock
+        tracker = VersionTracker(use_content_hash=True)
+        with mock.patch("antaris_memory.versioning._CONTENT_CAP", 0), \
+                mock.patch("antaris_memory.versioning._content_hash",
+                           side_effect=AssertionError("hashed")), \
+                mock.patch("antaris_memory.versioning._bytes_hash",
+                           side_effect=AssertionError("hashed")):
+            result = tracker.safe_update(
+                self.path, lambda data: {**data, "count": data["count"] + 1})
+        self.assertEqual(result["count"], 1)
+    
     def test_safe_update_retries_on_conflict(self):
         tracker = VersionTracker()
         call_count = [0]
@@ -100,11 +120,67 @@ class TestVersionTracker(unittest.TestCase):
         self.assertEqual(call_count[0], 2)
         self.assertEqual(result["count"], 101)  # 100 + 1
     
+    def test_content_check_ignores_restored_mtime(self):
+        """Same size and mtime but different bytes is still a conflict."""
+        from unittest import mock
+        for cap in (4 * 1024 * 1024, 0):  # bytes compare, then digest compare
+            with mock.patch("antaris_memory.versioning._CONTENT_CAP", cap):
+                with open(self.path, "w") as f:
+                    json.dump({"count": 1}, f)
+                tracker = VersionTracker(use_content_hash=True)
+                version = tracker.snapshot(self.path)
+                self.assertEqual(version.content_bytes is None, cap == 0)
+                tracker.check(version)
+
+                stat = os.stat(self.path)
+                with open(self.path, "w") as f:
+                    json.dump({"count": 2}, f)
+                os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+                with self.assertRaises(ConflictError):
+                    tracker.check(version)
+
+    def test_check_many_reports_every_conflict(self):
+        from unittest import mock
+        paths = [os.path.join(self.tmpdir, f"f{i}.json") for i in range(3)]
+        for scandir in (False, True):
+            with mock.patch("antaris_memory.versioning._SCANDIR_STAT", scandir):
+                for p in paths:
+                    with open(p, "w") as f:
+                        json.dump({"v": 0}, f)
+                tracker = VersionTracker()
+                versions = [tracker.snapshot(p) for p in paths]
+                tracker.check_many(versions)  # unchanged: no error
+
+                time.sleep(0.01)
+                with open(paths[0], "w") as f:
+                    json.dump({"v": 10}, f)
+                os.unlink(paths[2])
+                with self.assertRaises(ConflictError) as ctx:
+                    tracker.check_many(versions)
+                self.assertEqual([e.path for e in ctx.exception.conflicts],
+                                 [paths[0], paths[2]])
+                self.assertIn("f2.json", str(ctx.exception))
+
     def test_conflict_error_message(self):
         err = ConflictError("/tmp/test.json", 1000.0, 2000.0)
         self.assertIn("test.json", str(err))
         self.assertIn("1000.0", str(err))
 
+    def test_version_uses_integer_mtime_ns(self):
+        tracker = VersionTracker()
+        version = tracker.snapshot(self.path)
+        stat = os.stat(self.path)
+        self.assertEqual(version.mtime_ns, stat.st_mtime_ns)
+        self.assertIsInstance(version.mtime_ns, int)
+
+        # A 1ns change is a conflict, and the error reports exact values
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertFalse(version.is_current())
+        with self.assertRaises(ConflictError) as ctx:
+            tracker.check(version)
+        self.assertEqual(ctx.exception.actual_mtime_ns, stat.st_mtime_ns + 1)
+        self.assertIn(f"mtime_ns={stat.st_mtime_ns}", str(ctx.exception))
+
 
 if __name__ == "__main__":
     unittest.main()